@@ -13,6 +13,10 @@ WIDTH: int = 480               # Screen width in pixels
 HEIGHT: int = 600              # Screen height in pixels
 FPS: int = 100                 # Target frames per second
 TITLE: str = "Skybound"        # Window title
+# The simulation advances in fixed ticks of 1000/FPS ms (all tuning below is
+# per tick); rendering happens once per loop pass.
+MAX_CATCHUP_TICKS: int = 5     # Ticks simulated per frame at most after a stall
+BG_SCROLL_SPEED: float = 0.15  # Gameplay sky parallax in px/ms (1.5px per tick)
 
 # --- Physics (shared by Player and Mob) ------------------------------------
 PLAYER_ACC: float = 0.5        # Gravity / acceleration magnitude
@@ -19,18 +19,20 @@ Date: July 2025
 """
 
 import pygame as pg
+import numpy as np
 import os
 from levels.level1 import LevelClass
 from utils.database_logic import (
     GetLevel, GetScore, GetHighScore, SetHighScore, SetScore, SetGamestate,
 )
+from utils.draw_text import get_font
 from utils.effects import EffectsManager
 from utils.sound_effects import (
     play_land_sound, play_victory_sound, play_damage_sound, play_coin_sound,
 )
 from utils.achievements import (
     check_level_achievement, check_coin_achievement,
-    check_no_damage_achievement, check_enemy_achievement,
+    check_no_damage_achievement, check_enemy_achievement, flush_achievements,
 )
 from utils.player_stats import player_stats
 from sprites.powerups import PowerUpManager
@@ -38,10 +40,157 @@ from windows.paus import Pause
 from utils import daily
 
 # Game configuration constants (see constants.py for the shared source of truth)
-from constants import WIDTH, HEIGHT, FPS, TITLE, WHITE
+from constants import (
+    WIDTH, HEIGHT, FPS, TITLE, WHITE, RED, GREEN, GOLD, MAX_CATCHUP_TICKS, BG_SCROLL_SPEED,
+)
 
 IMG_FOLDER_PATH : str = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
 
+# HUD / feedback colours used by the loop (shared ones live in constants.py)
+PROJECTILE_HIT_COLOR: tuple = (255, 100, 0)  # Explosion when a shot hits the player
+EMPTY_HEART_COLOR: tuple = (100, 100, 100)   # Lost-health slots in the heart row
+EFFECT_COLORS: dict = {                      # Active power-up bars, by effect name
+    "Speed":       (255, 255, 0),
+    "Jump":        (0, 255, 0),
+    "Shield":      (0, 191, 255),
+    "Double Jump": (255, 0, 255),
+    "Magnet":      (255, 140, 0),
+}
+
+
+# Window icon, HUD font and HUD icons, loaded by the first Loop and reused by
+# every later one (a new Loop is built for each level).
+_hud_assets = None
+
+
+def _load_hud_assets():
+    """Return ``(window_icon, font, icons)``, loading them from disk once.
+
+    Needs an open display, since the icons are converted for fast blitting.
+    """
+    global _hud_assets
+    if _hud_assets is not None:
+        return _hud_assets
+
+    # Only handed to the window manager, never blitted, so not converted.
+    window_icon = pg.image.load(os.path.join(IMG_FOLDER_PATH, 'icon.png'))
+
+    # UI font, shared with draw_text's per-size cache
+    font = get_font(16)
+
+    # Load HUD power-up icons (32×32 source; scaled to 16×16 for the HUD bar).
+    # Keys match the effect names returned by Player.get_active_effects() and
+    # the special-purpose "health" / "coin" entries used by draw_ui().
+    icon_folder = os.path.join(IMG_FOLDER_PATH, "icons")
+    _icon_map = {
+        "Speed":       "icon_speed.png",
+        "Jump":        "icon_jump.png",
+        "Shield":      "icon_shield.png",
+        "Double Jump": "icon_double_jump.png",
+        "Magnet":      "icon_magnet.png",
+        "health":      "icon_health.png",
+        "coin":        "icon_coin.png",
+    }
+    icons = {}
+    for key, fname in _icon_map.items():
+        try:
+            raw = pg.image.load(os.path.join(icon_folder, fname)).convert_alpha()
+            icons[key] = pg.transform.scale(raw, (16, 16))
+        except Exception:
+            icons[key] = None  # missing asset → skip blit gracefully
+
+    _hud_assets = (window_icon, font, icons)
+    return _hud_assets
+
+
+class QuadTree:
+    """
+    Region quadtree over sprite rects, used as the collision broad phase.
+
+    Each node covers ``bounds`` and holds the ``(rect, sprite)`` pairs that do
+    not fit entirely inside one of its four children. A leaf splits once it
+    holds more than ``THRESHOLD`` items, so a query only visits the few nodes
+    overlapping the probe instead of testing every sprite in a group.
+
+    ``query()`` does the narrow phase too (``Rect.colliderect`` per candidate),
+    so its result is exactly the set ``pg.sprite.spritecollide`` would return.
+
+    Attributes:
+        bounds (pg.Rect): Area covered by this node
+        children (list | None): The four sub-quadrants once split, else None
+        items (list): ``(rect, sprite)`` pairs stored at this node
+    """
+    THRESHOLD = 4   # Items a leaf holds before it splits
+    MAX_DEPTH = 6   # Stop splitting below ~7px cells on a 480x600 screen
+
+    def __init__(self, bounds, depth=0):
+        self.bounds = pg.Rect(bounds)
+        self.depth = depth
+        self.children = None
+        self.items = []
+
+    def insert(self, rect, sprite):
+        """Insert ``sprite`` keyed by ``rect`` (rects are stored by reference)."""
+        if self.children is not None:
+            for child in self.children:
+                if child.bounds.contains(rect):
+                    child.insert(rect, sprite)
+                    return
+        self.items.append((rect, sprite))
+        if (self.children is None and len(self.items) > self.THRESHOLD
+                and self.depth < self.MAX_DEPTH):
+            self._split()
+
+    def _split(self):
+        x, y, w, h = self.bounds
+        hw, hh = w // 2, h // 2
+        depth = self.depth + 1
+        self.children = [
+            QuadTree((x, y, hw, hh), depth),
+            QuadTree((x + hw, y, w - hw, hh), depth),
+            QuadTree((x, y + hh, hw, h - hh), depth),
+            QuadTree((x + hw, y + hh, w - hw, h - hh), depth),
+        ]
+        items, self.items = self.items, []
+        for rect, sprite in items:
+            self.insert(rect, sprite)
+
+    def query(self, rect, out=None):
+        """Return the sprites whose rect overlaps ``rect``."""
+        if out is None:
+            out = []
+        for item_rect, sprite in self.items:
+            if item_rect.colliderect(rect):
+                out.append(sprite)
+        if self.children is not None:
+            for child in self.children:
+                if child.bounds.colliderect(rect):
+                    child.query(rect, out)
+        return out
+
+    @classmethod
+    def from_sprites(cls, sprites, bounds=(0, 0, WIDTH, HEIGHT)):
+        """Build a tree over ``sprite.rect`` for every sprite in ``sprites``."""
+        tree = cls(bounds)
+        for sprite in sprites:
+            tree.insert(sprite.rect, sprite)
+        return tree
+
+
+def aabb_overlaps(boxes_a, boxes_b):
+    """Pairwise overlap test between two ``(N, 4)`` arrays of boxes.
+
+    Boxes are ``(left, top, right, bottom)`` rows. Returns an
+    ``(len(boxes_a), len(boxes_b))`` bool matrix with ``Rect.colliderect``
+    semantics (boxes that only share an edge do not overlap), computed with
+    broadcast comparisons instead of a Python double loop.
+    """
+    a = boxes_a[:, None, :]
+    b = boxes_b[None, :, :]
+    return ((a[..., 0] < b[..., 2]) & (a[..., 2] > b[..., 0])
+            & (a[..., 1] < b[..., 3]) & (a[..., 3] > b[..., 1]))
+
+
 class Loop():
     """
     Main game loop class that handles active gameplay.
@@ -57,19 +206,18 @@ class Loop():
     - Level progression and transitions
     - Game over conditions
     
-    The loop runs at a high frame rate (100 FPS) to ensure smooth gameplay
-    and responsive controls.
+    The simulation runs in fixed ticks at a high rate (100 per second) to
+    ensure smooth gameplay and responsive controls; rendering happens once
+    per loop pass, so a slow frame no longer slows the game down.
     
     Attributes:
         main: Reference to the main game instance
         screen: Pygame display surface
         clock: Pygame clock for frame rate control
-        bg_scroll: Background scrolling offset
         running: Main loop control flag
         level: Current level instance
-        background/background2: Background images for parallax scrolling
-        mouse: Mouse position tuple
-        click: Mouse click state
+        background: Background image; it and its mirror alternate as parallax tiles
+        bg_scroll: Parallax offset into the background strip (wraps every two tiles)
         effects_manager: Manages particle effects and visual feedback
         powerup_manager: Handles power-up spawning and management
         font: Font for UI text rendering
@@ -99,19 +247,30 @@ class Loop():
         
         # Visual and game state
         self.bg_scroll = 0                      # Background scrolling offset
+        self._frame_ms = 1000 / FPS             # Wall time of the last rendered frame
         self.running = True                     # Main loop control flag
         self.level = None                       # Current level instance
-        self.background = None                  # Primary background image
-        self.background2 = None                 # Secondary background for parallax
+        self.background = None                  # Level background image
+        self._bg_strip = None                   # mirror | background | mirror head, see load_level
         
         # Input handling
-        self.mouse = None                       # Mouse position
-        self.click = None                       # Mouse click state
         
         # Game systems
         self.effects_manager = EffectsManager()   # Particle effects and visual feedback
         self.powerup_manager = PowerUpManager()   # Power-up spawning and management
         self.font = None                         # Font for UI text
+        self._ui_cache = {}                      # (kind, *values) -> rendered HUD text
+        self._heart_strips = None                # (max_health, full strip, empty strip)
+        self._shield_surface = None              # Shield bubble, built on first use
+
+        # Collision broad phase (see QuadTree). Platforms are static, so their
+        # tree is built once per level; mobs move every tick.
+        self._platform_qt = None
+        self._mob_qt = None
+        # Platform boxes as (left, top, right, bottom) rows, in _plat_list
+        # order, for the vectorised mob landing test.
+        self._plat_boxes = np.empty((0, 4))
+        self._plat_list = []
         
         # Player state tracking
         self.player_was_on_floor = False         # For landing effect detection
@@ -130,38 +289,10 @@ class Loop():
         pg.init()
         self.screen = pg.display.set_mode((WIDTH, HEIGHT))
         pg.display.set_caption(TITLE)
-        icon = pg.image.load(os.path.join(IMG_FOLDER_PATH, 'icon.png'))
-        pg.display.set_icon(icon)
+        window_icon, self.font, self.icons = _load_hud_assets()
+        pg.display.set_icon(window_icon)
         self.clock = pg.time.Clock()
 
-        # Load font for UI
-        try:
-            font_path = os.path.join(os.path.dirname(__file__), "..", "font", "Outfit-Regular.ttf")
-            self.font = pg.font.Font(font_path, 16)
-        except Exception:
-            self.font = pg.font.Font(None, 16)
-
-        # Load HUD power-up icons (32×32 source; scaled to 16×16 for the HUD bar).
-        # Keys match the effect names returned by Player.get_active_effects() and
-        # the special-purpose "health" / "coin" entries used by draw_ui().
-        icon_folder = os.path.join(IMG_FOLDER_PATH, "icons")
-        _icon_map = {
-            "Speed":       "icon_speed.png",
-            "Jump":        "icon_jump.png",
-            "Shield":      "icon_shield.png",
-            "Double Jump": "icon_double_jump.png",
-            "Magnet":      "icon_magnet.png",
-            "health":      "icon_health.png",
-            "coin":        "icon_coin.png",
-        }
-        self.icons = {}
-        for key, fname in _icon_map.items():
-            try:
-                raw = pg.image.load(os.path.join(icon_folder, fname)).convert_alpha()
-                self.icons[key] = pg.transform.scale(raw, (16, 16))
-            except Exception:
-                self.icons[key] = None  # missing asset → skip blit gracefully
-
     def startgame(self):
         self.level = LevelClass(self)
         self.load_level()
@@ -172,16 +303,44 @@ class Loop():
             self.level.level1()
         elif GetLevel() > 1:
             self.level.level2()
-        self.background = self.level.sky
-        self.background2 = pg.transform.flip(self.background, True, False).convert()
+        # The parallax alternates the sky with its mirror image. One strip
+        # [mirror | sky | first WIDTH px of mirror] holds a whole period plus
+        # enough overlap that any WIDTH-wide window into it is contiguous, so
+        # draw() needs a single source-rect blit and never flips or swaps.
+        # The strip is at least screen-high (padded with WHITE for shorter
+        # skies), so that blit repaints every pixel and no clear is needed.
+        self.background = self.level.sky  # already opaque, display format
+        bg_width, bg_height = self.background.get_size()
+        mirror = pg.transform.flip(self.background, True, False)
+        self._bg_strip = pg.Surface((2 * bg_width + WIDTH, max(bg_height, HEIGHT))).convert()
+        self._bg_strip.fill(WHITE)
+        self._bg_strip.blit(mirror, (0, 0))
+        self._bg_strip.blit(self.background, (bg_width, 0))
+        self._bg_strip.blit(mirror, (2 * bg_width, 0))
+        self._platform_qt = QuadTree.from_sprites(self.platforms)
+        self._plat_list = self.platforms.sprites()
+        self._plat_boxes = np.array(
+            [(p.rect.left, p.rect.top, p.rect.right, p.rect.bottom) for p in self._plat_list],
+            dtype=float,
+        ).reshape(-1, 4)
         self.level_start_time = pg.time.get_ticks()
         self.player_took_damage_this_level = False
 
     def run(self):
+        # Fixed-step accumulator: update() advances one tick of 1000/FPS ms
+        # (everything is tuned per tick), as many times as wall time demands,
+        # then the frame is drawn once. Catch-up is capped after a stall so a
+        # long hitch cannot snowball into ever more ticks per frame.
+        tick_ms = 1000 / FPS
+        max_acc = tick_ms * MAX_CATCHUP_TICKS
+        acc = 0.0
         while self.running:
-            self.clock.tick(FPS)
+            self._frame_ms = self.clock.tick(FPS)
+            acc = min(acc + self._frame_ms, max_acc)
             self.handle_events()
-            self.update()
+            while acc >= tick_ms and self.running:
+                self.update()
+                acc -= tick_ms
             self.draw()
 
     def handle_events(self):
@@ -193,37 +352,50 @@ class Loop():
     def update(self):
         # Effects always animate (incl. shake during a freeze). If a hit-stop
         # is active, skip the gameplay simulation this frame for impact.
-        self.effects_manager.update()
-        if self.effects_manager.is_hit_stopped():
+        effects = self.effects_manager
+        effects.update()
+        if effects.is_hit_stopped():
             return
 
-        self.player.update()
-        self.powerup_manager.update(self.platforms, self.player)
+        player = self.player
+        player.update()
+        self.powerup_manager.update(self.platforms, player)
         self.handle_collisions()
         
-        # Update mob AI with player position
+        # Update mob AI with player position (settled for this tick by now)
+        ppos = player.pos
         for mob in self.mobs:
-            if hasattr(mob, 'update'):
-                mob.update(self.player.pos)
-            if hasattr(mob, 'chase_player'):
-                mob.chase_player(self.player.pos)
+            mob.update(ppos)
+        for mob in self.chaser_mobs:
+            mob.chase_player(ppos)
+        # Every mob's shots advance together in the shared group.
+        self.all_projectiles.update()
                 
         # Check for landing effects
-        if not self.player_was_on_floor and self.player.on_floor:
-            self.effects_manager.create_landing_dust(
-                self.player.pos.x, self.player.pos.y,
-                self.player.vel.x * 0.5
-            )
-            self.player.land()  # squash on touchdown
+        if not self.player_was_on_floor and player.on_floor:
+            pos_x, pos_y = ppos
+            effects.create_landing_dust(pos_x, pos_y, player.vel.x * 0.5)
+            player.land()  # squash on touchdown
             play_land_sound()
             
-        self.player_was_on_floor = self.player.on_floor
+        self.player_was_on_floor = player.on_floor
 
     def handle_collisions(self):
-        # Platform landing (one-way / pass-through) for player and all mobs
-        self.player.resolve_platform_landing(self.platforms)
-        for mob in self.mobs:
-            mob.resolve_platform_landing(self.platforms)
+        # Platform landing (one-way / pass-through) for player and all mobs,
+        # each only tested against the platforms near its fall this frame.
+        # The player queries the platform tree; every mob's probe is tested
+        # against every platform in one broadcast comparison.
+        self.player.resolve_platform_landing(self._landing_candidates(self.player))
+        mobs = self.mobs.sprites()
+        if mobs:
+            probes = np.array([self._landing_probe(mob) for mob in mobs], dtype=float)
+            hits = aabb_overlaps(probes, self._plat_boxes)
+            platforms = self._plat_list
+            for mob, row in zip(mobs, hits):
+                mob.resolve_platform_landing([platforms[j] for j in np.flatnonzero(row)])
+
+        # Mobs moved this tick, so rebuild their tree now.
+        self._mob_qt = QuadTree.from_sprites(self.mobs)
 
         self._check_goal_collision()
         self._check_mob_collision()
@@ -231,6 +403,26 @@ class Loop():
         self._check_powerup_collision()
         self._check_pause_button()
 
+    @staticmethod
+    def _landing_probe(body):
+        """``(left, top, right, bottom)`` of the area the body's feet swept.
+
+        The probe spans the body's collider horizontally and its feet travel
+        (``prev_bottom`` -> ``pos.y``) vertically, padded by a pixel so a body
+        resting exactly on a top edge still finds its platform.
+        """
+        collider = getattr(body, "hitbox", body.rect)
+        feet = body.pos.y
+        return (
+            collider.left, min(body.prev_bottom, feet) - 1,
+            collider.right, max(body.prev_bottom, feet) + 1,
+        )
+
+    def _landing_candidates(self, body):
+        """Platforms whose top the body's feet could have crossed this frame."""
+        left, top, right, bottom = self._landing_probe(body)
+        return self._platform_qt.query(pg.Rect(left, top, right - left, bottom - top))
+
     def _check_goal_collision(self):
         if not pg.sprite.spritecollide(self.player, self.goals, False):
             return
@@ -252,14 +444,15 @@ class Loop():
 
         for achievement in level_achievements:
             if achievement:
-                self.effects_manager.add_floating_text(
-                    WIDTH / 2, 100, f"Achievement: {achievement.name}!", (255, 215, 0)
+                self._add_popup(
+                    WIDTH / 2, 100, f"Achievement: {achievement.name}!", GOLD
                 )
                 if achievement.reward > 0:
-                    self.effects_manager.add_floating_text(
-                        WIDTH / 2, 120, f"+{achievement.reward} coins!", (255, 215, 0)
+                    self._add_popup(
+                        WIDTH / 2, 120, f"+{achievement.reward} coins!", GOLD
                     )
 
+        flush_achievements()  # one write for everything unlocked this level
         SetHighScore(GetScore())
         player_stats.save_stats(self.player)
         if daily.is_active():
@@ -267,178 +460,197 @@ class Loop():
         SetScore(GetScore() + 1)
         self.running = False
         play_victory_sound()
-        self.effects_manager.create_explosion(self.player.pos.x, self.player.pos.y, (0, 255, 0))
+        self.effects_manager.create_explosion(self.player.pos.x, self.player.pos.y, GREEN)
         if GetScore() > GetHighScore() and GetScore() > 2:
             SetGamestate("NEW_HIGHSCORE")
         else:
             SetGamestate("GAME_OVER")
 
     def _check_mob_collision(self):
-        if not pg.sprite.spritecollide(self.player, self.mobs, False):
+        if not self._mob_qt.query(self.player.rect):
             return
 
-        if self.player.take_damage():
-            self.player_took_damage_this_level = True
-            play_damage_sound()
-            self.effects_manager.start_hit_stop(6)
-            self.effects_manager.create_explosion(self.player.pos.x, self.player.pos.y, (255, 0, 0))
-            self.effects_manager.add_floating_text(
-                self.player.pos.x, self.player.pos.y - 20, "OUCH!", (255, 0, 0)
-            )
+        x, y = self.player.pos
+        if self._apply_damage(x, y, RED):
+            self._add_popup(x, y - 20, "OUCH!", RED)
             # Track enemy encounters for the Monster Slayer achievement.
             self.total_mob_encounters += 1
             enemy_achievement = check_enemy_achievement(self.total_mob_encounters)
             if enemy_achievement:
-                self.effects_manager.add_floating_text(
-                    WIDTH / 2, 140, f"Achievement: {enemy_achievement.name}!", (255, 215, 0)
+                self._add_popup(
+                    WIDTH / 2, 140, f"Achievement: {enemy_achievement.name}!", GOLD
                 )
 
-        if self.player.is_dead():
-            self._player_died()
-
     def _check_projectile_collision(self):
-        for mob in self.mobs:
-            if not hasattr(mob, 'projectiles'):
-                continue
-            if not pg.sprite.spritecollide(self.player, mob.projectiles, True):
-                continue
-            if self.player.take_damage():
-                self.player_took_damage_this_level = True
-                play_damage_sound()
-                self.effects_manager.start_hit_stop(6)
-                self.effects_manager.create_explosion(
-                    self.player.pos.x, self.player.pos.y, (255, 100, 0)
-                )
-            if self.player.is_dead():
-                self._player_died()
+        # One scan over every live projectile; dokill also drops the hits
+        # from their owning mob's group.
+        if not pg.sprite.spritecollide(self.player, self.all_projectiles, True):
+            return
+        self._apply_damage(self.player.pos.x, self.player.pos.y, PROJECTILE_HIT_COLOR)
+
+    def _apply_damage(self, x, y, color):
+        """Shared hit handling for mob and projectile contact.
+
+        Applies the damage feedback (sound, hit-stop, explosion in ``color``
+        at ``x, y``) if the player actually took damage, then ends the run if
+        that hit was fatal. Returns whether damage was taken.
+        """
+        player = self.player
+        damaged = player.take_damage()
+        if damaged:
+            self.player_took_damage_this_level = True
+            play_damage_sound()
+            self.effects_manager.start_hit_stop(6)
+            self.effects_manager.create_explosion(x, y, color)
+        if player.is_dead():
+            self._player_died()
+        return damaged
 
     def _check_powerup_collision(self):
         self.powerup_manager.check_collisions(self.player)
 
-        for powerup in self.powerup_manager.power_ups:
-            if not powerup.collected:
-                continue
+        for powerup in self.powerup_manager.drain_collected():
             self.effects_manager.create_collectible_effect(
                 powerup.pos.x, powerup.pos.y, powerup.image.get_at((0, 0))[:3]
             )
             play_coin_sound()
 
-            if hasattr(powerup, 'value'):  # Coin
+            if hasattr(powerup, 'value'):  # Coin (Coin.collect already paid it)
                 self.total_coins_collected += powerup.value
-                self.player.add_coins(powerup.value)
                 coin_achievements = check_coin_achievement(self.total_coins_collected)
                 for achievement in coin_achievements:
                     if achievement:
-                        self.effects_manager.add_floating_text(
-                            WIDTH / 2, 120, f"Achievement: {achievement.name}!", (255, 215, 0)
+                        self._add_popup(
+                            WIDTH / 2, 120, f"Achievement: {achievement.name}!", GOLD
                         )
                         if achievement.reward > 0:
-                            self.effects_manager.add_floating_text(
-                                WIDTH / 2, 140, f"+{achievement.reward} coins!", (255, 215, 0)
+                            self._add_popup(
+                                WIDTH / 2, 140, f"+{achievement.reward} coins!", GOLD
                             )
-                self.effects_manager.add_floating_text(
-                    powerup.pos.x, powerup.pos.y - 20, f"+{powerup.value}", (255, 215, 0)
+                self._add_popup(
+                    powerup.pos.x, powerup.pos.y - 20, f"+{powerup.value}", GOLD
                 )
             else:
                 label = powerup.__class__.__name__.replace('Boost', '').replace('Potion', '').upper()
-                self.effects_manager.add_floating_text(
-                    powerup.pos.x, powerup.pos.y - 20, label, (255, 255, 255)
+                self._add_popup(
+                    powerup.pos.x, powerup.pos.y - 20, label, WHITE
                 )
 
     def _check_pause_button(self):
-        self.mouse = pg.mouse.get_pos()
-        self.click = pg.mouse.get_pressed()
-        bx, by = self.closebutton.rect.x, self.closebutton.rect.y
-        if bx < self.mouse[0] < bx + 50 and by < self.mouse[1] < by + 50:
-            if self.click[0] == 1:
-                Pause(self, self.main)
+        # The position only matters while the left button is held.
+        if pg.mouse.get_pressed()[0] and self.closebutton.rect.collidepoint(pg.mouse.get_pos()):
+            Pause(self, self.main)
 
     def _player_died(self):
         player_stats.reset_stats()
+        flush_achievements()
         self.running = False
         SetScore(1)
         SetGamestate("GAME_OVER")
 
     def draw(self):
-        self.screen.fill(WHITE)
-        
-        # Apply screen shake
+        screen = self.screen
+        blit = screen.blit
+
+        # The background and sprites are drawn unshaken and then shifted once
+        # by the shake offset below, instead of offsetting every blit.
+        # Power-ups stay still, as they always have.
         shake_offset = self.effects_manager.get_shake_offset()
-        
-        # Draw background with shake offset
-        self.bg_scroll += 1.5
-        if self.bg_scroll >= self.background.get_width():
-            self.bg_scroll = 0
-            self.background = pg.transform.flip(self.background, True, False).convert()
-            self.background2 = pg.transform.flip(self.background2, True, False).convert()
-            
-        bg_x = WIDTH - self.background.get_width() + self.bg_scroll + shake_offset[0]
-        bg_y = 0 + shake_offset[1]
-        self.screen.blit(self.background, (bg_x, bg_y))
-        
-        if self.bg_scroll > self.background.get_width() - WIDTH:
-            bg2_x = WIDTH - self.background.get_width() * 2 + self.bg_scroll + shake_offset[0]
-            bg2_y = 0 + shake_offset[1]
-            self.screen.blit(self.background2, (bg2_x, bg2_y))
-            
-        # Draw sprites with shake offset. Anchor each image by its midbottom so
-        # the player's squash/stretch (which scales image but not rect) stays
-        # planted; for every other sprite image size == rect size, so this is
-        # identical to a topleft blit. The whole batch is drawn in one
-        # pygame-ce fblits() call rather than N Python-level blit() calls.
-        sprite_blits = []
-        for sprite in self.all_sprites:
-            sprite_rect = sprite.rect.copy()
-            sprite_rect.x += shake_offset[0]
-            sprite_rect.y += shake_offset[1]
-
-            # Handle player invincibility flashing
-            if sprite == self.player and self.player.should_flash():
-                # Skip drawing the player when flashing
-                continue
-
-            blit_rect = sprite.image.get_rect(midbottom=sprite_rect.midbottom)
-            sprite_blits.append((sprite.image, blit_rect))
-
-        self.screen.fblits(sprite_blits)
-            
-        # Draw power-ups
-        self.powerup_manager.draw(self.screen)
-        
-        # Draw projectiles from mobs
-        for mob in self.mobs:
-            if hasattr(mob, 'projectiles'):
-                for projectile in mob.projectiles:
-                    proj_rect = projectile.rect.copy()
-                    proj_rect.x += shake_offset[0]
-                    proj_rect.y += shake_offset[1]
-                    self.screen.blit(projectile.image, proj_rect)
-        
+        shaking = shake_offset != (0, 0)
+
+        # Draw background: the view starts at the sky's right edge and pans
+        # left through sky, mirror, sky, ... as bg_scroll grows.
+        bg_width = self.background.get_width()
+        period = 2 * bg_width
+        self.bg_scroll = (self.bg_scroll + BG_SCROLL_SPEED * self._frame_ms) % period
+        src_x = int(period - WIDTH - self.bg_scroll) % period
+        blit(self._bg_strip, (0, 0), (src_x, 0, WIDTH, HEIGHT))
+
+        # The player is kept out of all_sprites: its squash/stretch scales the
+        # image but not the rect, so it is anchored by its midbottom to keep
+        # the feet planted, and it is skipped while flashing. It was always
+        # the first member of the group, so drawing it first keeps the order.
+        player = self.player
+        if not player.should_flash():
+            player_img = player.image
+            blit(player_img, player_img.get_rect(midbottom=player.rect.midbottom))
+
+        # Every other sprite's image matches its rect: one C-side batch blit.
+        self.all_sprites.draw(screen)
+
+        if shaking:
+            self._shift_world(*shake_offset)
+
+        # Draw power-ups (never shaken)
+        self.powerup_manager.draw(screen)
+
+        # Draw projectiles from mobs, shaken along with the world
+        if shaking:
+            screen.fblits(
+                [(p.image, p.rect.move(shake_offset)) for p in self.all_projectiles]
+            )
+        else:
+            self.all_projectiles.draw(screen)
+
         # Draw UI
         self.draw_ui()
         
         # Draw effects last (no shake offset for UI elements)
-        self.effects_manager.draw(self.screen, self.font)
+        self.effects_manager.draw(screen, self.font)
         
         pg.display.flip()
 
+    def _shift_world(self, dx, dy):
+        """Scroll the drawn world by the shake offset and clear the uncovered
+        edges to WHITE (scroll leaves last frame's pixels there), matching the
+        white fill that used to show behind the offset background."""
+        screen = self.screen
+        screen.scroll(dx, dy)
+        if dx > 0:
+            screen.fill(WHITE, (0, 0, dx, HEIGHT))
+        elif dx < 0:
+            screen.fill(WHITE, (WIDTH + dx, 0, -dx, HEIGHT))
+        if dy > 0:
+            screen.fill(WHITE, (0, 0, WIDTH, dy))
+        elif dy < 0:
+            screen.fill(WHITE, (0, HEIGHT + dy, WIDTH, -dy))
+
+    def _add_popup(self, x, y, text, color):
+        """Float ``text`` up from (x, y), reusing its rendered surface for
+        every later popup with the same text and colour."""
+        surface = self._ui_text(("popup", text, color), text, color)
+        self.effects_manager.add_floating_surface(x, y, surface)
+
+    def _ui_text(self, key, text, color):
+        """Return the HUD text surface for ``key``, rendering it only the first
+        time that combination of values is seen."""
+        surface = self._ui_cache.get(key)
+        if surface is None:
+            surface = self._ui_cache[key] = self.font.render(text, True, color)
+        return surface
+
     def draw_ui(self):
         """Draw the game UI including health, coins, and power-up indicators."""
+        player = self.player
         # ---- Health row ----
         health_icon = self.icons.get("health")
         hx = 10
         if health_icon:
             self.screen.blit(health_icon, (hx, HEIGHT - 80))
             hx += 20
-        health_text = f"Health: {self.player.health}/{self.player.max_health}"
-        health_surface = self.font.render(health_text, True, (255, 255, 255))
+        health_surface = self._ui_text(
+            ("health", player.health, player.max_health),
+            f"Health: {player.health}/{player.max_health}", WHITE,
+        )
         self.screen.blit(health_surface, (hx, HEIGHT - 80))
 
-        # Draw health hearts
-        for i in range(self.player.max_health):
-            heart_color = (255, 0, 0) if i < self.player.health else (100, 100, 100)
-            heart_rect = pg.Rect(10 + i * 20, HEIGHT - 60, 16, 16)
-            pg.draw.rect(self.screen, heart_color, heart_rect)
+        # Draw health hearts: the full strip up to the current health, the
+        # empty strip for the rest of the row.
+        _, hearts_full, hearts_empty = self._get_heart_strips()
+        row_w = hearts_full.get_width()
+        cut = max(0, min(player.health * 20, row_w))
+        self.screen.blit(hearts_full, (10, HEIGHT - 60), (0, 0, cut, 16))
+        self.screen.blit(hearts_empty, (10 + cut, HEIGHT - 60), (cut, 0, row_w - cut, 16))
 
         # ---- Coins row ----
         coin_icon = self.icons.get("coin")
@@ -446,27 +658,21 @@ class Loop():
         if coin_icon:
             self.screen.blit(coin_icon, (cx, HEIGHT - 40))
             cx += 20
-        coin_text = f"Coins: {self.player.coins}"
-        coin_surface = self.font.render(coin_text, True, (255, 215, 0))
+        coin_surface = self._ui_text(
+            ("coins", player.coins), f"Coins: {player.coins}", GOLD
+        )
         self.screen.blit(coin_surface, (cx, HEIGHT - 40))
 
         # ---- Level ----
-        level_text = f"Level: {GetScore()}"
-        level_surface = self.font.render(level_text, True, (255, 255, 255))
+        level = GetScore()
+        level_surface = self._ui_text(("level", level), f"Level: {level}", WHITE)
         self.screen.blit(level_surface, (10, HEIGHT - 20))
 
         # ---- Active power-up effects (top-right) ----
-        active_effects = self.player.get_active_effects()
-        effect_colors = {
-            "Speed":       (255, 255, 0),
-            "Jump":        (0, 255, 0),
-            "Shield":      (0, 191, 255),
-            "Double Jump": (255, 0, 255),
-            "Magnet":      (255, 140, 0),
-        }
+        active_effects = player.get_active_effects()
         for i, (effect_name, duration) in enumerate(active_effects):
             effect_y = 70 + i * 25
-            effect_color = effect_colors.get(effect_name, (255, 255, 255))
+            effect_color = EFFECT_COLORS.get(effect_name, WHITE)
             icon_surf = self.icons.get(effect_name)
 
             # Background
@@ -485,18 +691,39 @@ class Loop():
                 self.screen.blit(icon_surf, (WIDTH - 98, effect_y + 2))
 
             # Effect name label
-            effect_text = self.font.render(effect_name, True, (255, 255, 255))
+            effect_text = self._ui_text(("effect", effect_name), effect_name, WHITE)
             text_rect = effect_text.get_rect(center=(WIDTH - 55, effect_y + 10))
             self.screen.blit(effect_text, text_rect)
 
         # ---- Shield bubble ----
-        if self.player.shield_active:
-            shield_surface = pg.Surface(
-                (self.player.rect.width + 10, self.player.rect.height + 10), pg.SRCALPHA
-            )
+        if player.shield_active:
+            self.screen.blit(self._get_shield_surface(), (player.rect.x - 5, player.rect.y - 5))
+
+    def _get_heart_strips(self):
+        """Return ``(max_health, full, empty)`` heart-row strips, rebuilding
+        them only when max_health changes (Extra Life raises it mid-level)."""
+        max_health = self.player.max_health
+        if self._heart_strips is None or self._heart_strips[0] != max_health:
+            row_w = max(max_health * 20 - 4, 0)
+            strips = []
+            for color in (RED, EMPTY_HEART_COLOR):
+                strip = pg.Surface((row_w, 16), pg.SRCALPHA)
+                for i in range(max_health):
+                    strip.fill(color, (i * 20, 0, 16, 16))
+                strips.append(strip.convert_alpha())
+            self._heart_strips = (max_health, *strips)
+        return self._heart_strips
+
+    def _get_shield_surface(self):
+        """Return the translucent shield ring, rebuilding it only if the
+        player's rect size has changed since it was drawn."""
+        size = (self.player.rect.width + 10, self.player.rect.height + 10)
+        if self._shield_surface is None or self._shield_surface.get_size() != size:
+            shield_surface = pg.Surface(size, pg.SRCALPHA)
             pg.draw.circle(
                 shield_surface, (0, 191, 255, 100),
-                (shield_surface.get_width() // 2, shield_surface.get_height() // 2),
-                shield_surface.get_width() // 2, 3,
+                (size[0] // 2, size[1] // 2),
+                size[0] // 2, 3,
             )
-            self.screen.blit(shield_surface, (self.player.rect.x - 5, self.player.rect.y - 5))
+            self._shield_surface = shield_surface.convert_alpha()
+        return self._shield_surface
@@ -21,7 +21,6 @@ Date: July 2025
 import pygame as pg
 import os
 import random
-import math
 
 # Import game sprites and components
 from sprites.player import Player
@@ -33,6 +32,8 @@ from sprites.pausebutton import Closebutton
 from constants import WIDTH, HEIGHT, MAX_REACH_V, MAX_REACH_H
 from levels.themes import theme_for_level, apply_tint
 
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
 
 def build_reachable_platforms(num_platforms, current_level, width, height, rng=random):
     """Generate a platform layout that is guaranteed climbable.
@@ -60,23 +61,30 @@ def build_reachable_platforms(num_platforms, current_level, width, height, rng=r
     max_w = max(50, 120 - current_level * 3)
     min_w = max(36, 80 - current_level * 3)
 
+    # Bound once: three draws per platform otherwise repeat the attribute
+    # lookup. Draw order is unchanged, so seeded layouts stay the same.
+    randint = rng.randint
+    w_lo, w_hi = min(min_w, max_w), max(min_w, max_w)
+
     plats = []
     prev_cx = width // 2
     prev_y = floor_top
     for _ in range(num_platforms):
-        gap = rng.randint(min_gap, MAX_REACH_V)
+        gap = randint(min_gap, MAX_REACH_V)
         y = prev_y - gap
         if y < 60:  # reached the top of the play area
             break
-        w = rng.randint(min(min_w, max_w), max(min_w, max_w))
+        w = randint(w_lo, w_hi)
         h = 20
         # Horizontal offset within reach, kept fully on screen.
-        cx = prev_cx + rng.randint(-MAX_REACH_H, MAX_REACH_H)
+        cx = prev_cx + randint(-MAX_REACH_H, MAX_REACH_H)
         cx = max(w // 2, min(width - w // 2, cx))
         plats.append(pg.Rect(cx - w // 2, y, w, h))
         prev_cx, prev_y = cx, y
 
-    plats.sort(key=lambda r: r.y)  # highest first
+    # Built floor-upward with strictly rising tops, so reversing yields the
+    # highest-first order without a sort.
+    plats.reverse()
     return plats
 
 
@@ -106,9 +114,29 @@ class LevelClass:
         game: Reference to the main game loop instance
         img_folder_path: Path to game image assets
         WIDTH/HEIGHT: Screen dimensions for level boundaries
-        skys: List of background images for visual variety
+        skys: Background filenames for visual variety (decoded on demand)
         sky: Currently selected background image
     """
+    # Background filenames for the default sky rotation (skys[0] is level 1's)
+    SKY_FILES = (
+        "sky2.png", "Freesky5.png", "Freesky2.png", "Freesky3.png", "Freesky4.png",
+        "Freesky14.png", "Freesky15.png", "Freesky7.png", "Freesky8.png",
+    )
+    # Decoded backgrounds shared by every LevelClass (a new one is built per
+    # level), keyed by filename. Only skies that are actually shown are loaded.
+    _sky_cache = {}
+
+    # Level 1 is static: its platforms as (x, y, w, h), floor first, and the
+    # Platform2 sprites built from them on first entry and reused after.
+    _LEVEL1_PLATFORM_SPECS = (
+        (0, 560, 480, 40),
+        (190, 450, 100, 20),
+        (90, 300, 100, 20),
+        (340, 200, 100, 20),
+        (140, 100, 100, 20),
+    )
+    _level1_platforms = None
+
     def __init__(self, game):
         """
         Initialize the level creation system.
@@ -119,64 +147,57 @@ class LevelClass:
         This initialization:
         1. Sets up paths to game assets (images, backgrounds)
         2. Defines screen dimensions for level boundaries
-        3. Loads multiple background images for visual variety
+        3. Fetches the default background (decoded once per process)
         4. Stores reference to game instance for sprite management
         """
         # Store reference to main game instance
         self.game = game
         
         # Set up asset paths
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
+        self.img_folder_path = IMG_FOLDER_PATH
         
         # Screen dimensions for level creation
         self.WIDTH = WIDTH
         self.HEIGHT = HEIGHT
 
-        # Load background images for visual variety across levels
-        self.skys = [
-            pg.image.load(
-                os.path.join(self.img_folder_path, "sky2.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky5.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky2.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky3.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky4.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky14.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky15.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky7.png")
-            ).convert_alpha(),
-            pg.image.load(
-                os.path.join(self.img_folder_path, "Freesky8.png")
-            ).convert_alpha(),
-        ]
-        
+        # Background filenames for visual variety across levels
+        self.skys = self.SKY_FILES
+
         # Set default background
-        self.sky = self.skys[0]
+        self.sky = self._load_sky(self.skys[0])
         self.theme = None
-        self._sky_cache = {}
 
-    def _load_sky(self, filename):
-        """Load (and cache) a themed background image by filename."""
-        if filename not in self._sky_cache:
-            self._sky_cache[filename] = pg.image.load(
-                os.path.join(self.img_folder_path, filename)
-            ).convert_alpha()
-        return self._sky_cache[filename]
+    @classmethod
+    def _load_sky(cls, filename):
+        """Load (and cache) a background image by filename.
+
+        Skies are fully opaque, so they are converted without per-pixel alpha.
+        """
+        if filename not in cls._sky_cache:
+            cls._sky_cache[filename] = pg.image.load(
+                os.path.join(IMG_FOLDER_PATH, filename)
+            ).convert()
+        return cls._sky_cache[filename]
+
+    def _reset_mob_groups(self):
+        """Give the game fresh (empty) mob groups for a new level."""
+        self.game.mobs = pg.sprite.Group()
+        self.game.chaser_mobs = pg.sprite.Group()      # mobs with chase_player()
+        self.game.all_projectiles = pg.sprite.Group()  # every live mob projectile
+
+    def _add_mobs(self, mobs):
+        """Add mobs to the game and to the typed groups their abilities need.
+
+        Sorting mobs here, once at spawn, lets the loop iterate only the
+        relevant mobs each frame instead of probing every mob with hasattr().
+        Each group gets a single batched add() for the whole list.
+        """
+        self.game.all_sprites.add(*mobs)
+        self.game.mobs.add(*mobs)
+        self.game.chaser_mobs.add(*[m for m in mobs if hasattr(m, 'chase_player')])
+        for mob in mobs:
+            if hasattr(mob, 'projectiles'):
+                mob.shared_projectiles = self.game.all_projectiles
 
     def level1(self):
         # Create level 1 (static)
@@ -189,15 +210,13 @@ class LevelClass:
             self.game.player = Player()
         else:
             # Reset player position for new level
-            self.game.player.pos = pg.Vector2(30, self.HEIGHT * 3 / 4)
-            self.game.player.rect.center = self.game.player.pos
-            self.game.player.vel = pg.Vector2(0, 0)
-            self.game.player.on_floor = False
+            self.game.player.respawn(30, self.HEIGHT * 3 / 4)
             
-        self.game.all_sprites.add(self.game.player)
+        # The player is drawn by the loop itself (feet-anchored), not via
+        # all_sprites.
         self.game.closebutton = Closebutton(10, 10, 50, 50)
         self.game.all_sprites.add(self.game.closebutton)
-        self.game.mobs = pg.sprite.Group()
+        self._reset_mob_groups()
         
         # Create mob at a safe distance from player and goal
         # Player is at (30, HEIGHT * 3 / 4), goal will be at (WIDTH / 2 - 100, 60)
@@ -205,26 +224,17 @@ class LevelClass:
         mob_x = self.WIDTH - 80  # Right side of screen
         mob_y = self.HEIGHT * 3 / 4 + 10
         self.game.mob = create_random_mob(mob_x, mob_y, 1)  # Level 1 mob
-        self.game.all_sprites.add(self.game.mob)
-        self.game.mobs.add(self.game.mob)
-
-        p1 = Platform2(0, self.HEIGHT - 40, self.WIDTH, 40)
-        self.game.all_sprites.add(p1)
-        self.game.platforms.add(p1)
-        p2 = Platform2(self.WIDTH / 2 - 50, self.HEIGHT * 3 / 4, 100, 20)
-        self.game.all_sprites.add(p2)
-        self.game.platforms.add(p2)
-        p3 = Platform2(self.WIDTH / 2 - 150, self.HEIGHT * 3 / 6, 100, 20)
-        self.game.all_sprites.add(p3)
-        self.game.platforms.add(p3)
-        p4 = Platform2(self.WIDTH / 2 + 100, self.HEIGHT * 3 / 9, 100, 20)
-        self.game.all_sprites.add(p4)
-        self.game.platforms.add(p4)
-        p5 = Platform2(self.WIDTH / 2 - 100, 100, 100, 20)
-        self.game.all_sprites.add(p5)
-        self.game.platforms.add(p5)
+        self._add_mobs([self.game.mob])
+
+        cls = type(self)
+        if cls._level1_platforms is None:
+            cls._level1_platforms = [Platform2(*spec) for spec in cls._LEVEL1_PLATFORM_SPECS]
+        platforms = cls._level1_platforms
+        for platform in platforms:
+            platform.kill()  # drop it from the previous run's groups
         goal = Goal(self.WIDTH / 2 - 100, 60, 20, 20)
-        self.game.all_sprites.add(goal)
+        self.game.all_sprites.add(*platforms, goal)
+        self.game.platforms.add(*platforms)
         self.game.goals.add(goal)
 
     def level2(self):
@@ -257,22 +267,18 @@ class LevelClass:
         if not hasattr(self.game, 'player') or self.game.player is None:
             self.game.player = Player()
         else:
-            # Reset player position and physics for new level
-            self.game.player.pos = pg.Vector2(30, self.HEIGHT * 3 / 4)
-            self.game.player.rect.center = self.game.player.pos
-            self.game.player.vel = pg.Vector2(0, 0)
-            self.game.player.on_floor = False
-            # Keep health, coins, and other progress
+            # Reset player position and physics for new level; keep health,
+            # coins, and other progress
+            self.game.player.respawn(30, self.HEIGHT * 3 / 4)
             
-        self.game.all_sprites.add(self.game.player)
+        # The player is drawn by the loop itself (feet-anchored), not via
+        # all_sprites.
         self.game.closebutton = Closebutton(10, 10, 50, 50)
         self.game.all_sprites.add(self.game.closebutton)
-        self.game.mobs = pg.sprite.Group()
+        self._reset_mob_groups()
 
         # Create floor Platform
         p1 = Platform2(0, self.HEIGHT - 40, self.WIDTH, 40, tint=self._plat_tint)
-        self.game.all_sprites.add(p1)
-        self.game.platforms.add(p1)
 
         # Build a reachable platform layout (guaranteed climbable by construction)
         base_platforms = 4
@@ -282,22 +288,23 @@ class LevelClass:
         platform_rects = build_reachable_platforms(
             num_platforms, current_level, self.WIDTH, self.HEIGHT, rng=gen_rng
         )
-        platforms = []
-        for r in platform_rects:
-            platform = Platform2(r.x, r.y, r.width, r.height, tint=self._plat_tint)
-            platforms.append(platform)
-            self.game.all_sprites.add(platform)
-            self.game.platforms.add(platform)
+        platforms = [
+            Platform2(r.x, r.y, r.width, r.height, tint=self._plat_tint)
+            for r in platform_rects
+        ]
+        self.game.all_sprites.add(p1, *platforms)
+        self.game.platforms.add(p1, *platforms)
 
         # Create multiple mobs based on level
         num_mobs = min(1 + current_level // 4, 3)  # 1 mob initially, +1 every 4 levels, max 3
 
+        # Mobs are collected here and added to the groups in one batch below.
+        new_mobs = []
+
         # Every 10th level is a boss encounter: one big boss, no regular mobs.
         if current_level % 10 == 0:
             num_mobs = 0
-            boss = BossMob(self.WIDTH // 2, 150)
-            self.game.all_sprites.add(boss)
-            self.game.mobs.add(boss)
+            new_mobs.append(BossMob(self.WIDTH // 2, 150))
 
         # Player spawn position
         player_spawn_x = 30
@@ -316,69 +323,51 @@ class LevelClass:
         self.game.all_sprites.add(goal)
         self.game.goals.add(goal)
         
-        def is_safe_spawn_position(x, y, min_distance=100):
+        min_distance_sq = 100 * 100  # Keep mobs 100px from the player and goal
+
+        def is_safe_spawn_position(x, y):
             """Check if a spawn position is safe (not too close to player or goal)"""
-            # Check distance from player
-            player_distance = math.sqrt((x - player_spawn_x)**2 + (y - player_spawn_y)**2)
-            if player_distance < min_distance:
+            # Compare squared distances; no sqrt needed against a fixed radius.
+            dx, dy = x - player_spawn_x, y - player_spawn_y
+            if dx * dx + dy * dy < min_distance_sq:
                 return False
-            
-            # Check distance from goal
-            goal_distance = math.sqrt((x - goal_x)**2 + (y - goal_y)**2)
-            if goal_distance < min_distance:
+
+            dx, dy = x - goal_x, y - goal_y
+            if dx * dx + dy * dy < min_distance_sq:
                 return False
-            
+
             return True
         
+        # Platforms whose spawn point (centre, 50px above the top) clears both
+        # safety radii. Filtering once up front means every mob is placed with
+        # a single random draw instead of retrying until a spot passes.
+        safe_platforms = [
+            p for p in platforms
+            if is_safe_spawn_position(p.rect.centerx, p.rect.top - 50)
+        ]
+        default_x, default_y = 440, self.HEIGHT * 3 / 4 + 10
+
         for i in range(num_mobs):
-            max_attempts = 20  # Prevent infinite loops
-            attempts = 0
-            mob_spawned = False
-            
-            while attempts < max_attempts and not mob_spawned:
-                if i == 0:
-                    # First mob - try default position first, then find alternative
-                    if attempts == 0:
-                        mob_x = 440
-                        mob_y = self.HEIGHT * 3 / 4 + 10
-                    else:
-                        # Find alternative position on a random platform
-                        if platforms:
-                            spawn_platform = random.choice(platforms)
-                            mob_x = spawn_platform.rect.centerx
-                            mob_y = spawn_platform.rect.top - 50
-                        else:
-                            mob_x = random.randint(50, self.WIDTH - 50)
-                            mob_y = self.HEIGHT // 2
-                else:
-                    # Additional mobs spawn on random platforms
-                    if platforms:
-                        spawn_platform = random.choice(platforms)
-                        mob_x = spawn_platform.rect.centerx + random.randint(-30, 30)
-                        mob_y = spawn_platform.rect.top - 50
-                        
-                        # Keep mob within platform bounds
-                        mob_x = max(spawn_platform.rect.left + 20, 
-                                   min(spawn_platform.rect.right - 20, mob_x))
-                    else:
-                        mob_x = random.randint(50, self.WIDTH - 50)
-                        mob_y = self.HEIGHT // 2
-                
-                # Check if the position is safe
-                if is_safe_spawn_position(mob_x, mob_y):
-                    mob = create_random_mob(mob_x, mob_y, current_level)
-                    self.game.all_sprites.add(mob)
-                    self.game.mobs.add(mob)
-                    mob_spawned = True
-                
-                attempts += 1
-            
-            # If we couldn't find a safe position, spawn at a fallback location
-            if not mob_spawned:
-                # Use the rightmost side of the screen as fallback
-                fallback_x = self.WIDTH - 60
-                fallback_y = self.HEIGHT - 100
-                mob = create_random_mob(fallback_x, fallback_y, current_level)
-                self.game.all_sprites.add(mob)
-                self.game.mobs.add(mob)
+            if i == 0 and is_safe_spawn_position(default_x, default_y):
+                # First mob - use the default position when it is safe
+                mob_x, mob_y = default_x, default_y
+            elif safe_platforms:
+                spawn_platform = random.choice(safe_platforms)
+                mob_x = spawn_platform.rect.centerx
+                mob_y = spawn_platform.rect.top - 50
+                if i > 0:
+                    # Additional mobs are spread along the platform, within its
+                    # bounds; keep the centre if the offset strays too close.
+                    offset_x = mob_x + random.randint(-30, 30)
+                    offset_x = max(spawn_platform.rect.left + 20,
+                                   min(spawn_platform.rect.right - 20, offset_x))
+                    if is_safe_spawn_position(offset_x, mob_y):
+                        mob_x = offset_x
+            else:
+                # No safe platform: use the rightmost side of the screen
+                mob_x = self.WIDTH - 60
+                mob_y = self.HEIGHT - 100
+            new_mobs.append(create_random_mob(mob_x, mob_y, current_level))
+
+        self._add_mobs(new_mobs)
         
@@ -54,6 +54,8 @@ class Main_Loop:
         gamesound (str): Path to the gameplay background music
         menusound (str): Path to the menu background music
         highscoresound (str): Path to the high score screen music
+        menu_snd, game_snd, highscore_snd (pygame.mixer.Sound): The decoded
+            music tracks, kept for the whole session
         channel1-4 (pygame.mixer.Channel): Audio channels for different music tracks
         current_window (object): Currently active window/screen instance
         running1 (bool): Main loop control flag
@@ -130,12 +132,18 @@ class Main_Loop:
         }
 
 
+        # Decode each music track once and keep the Sound for the session,
+        # so replaying a track never goes back to disk.
+        self.menu_snd = pg.mixer.Sound(self.menusound)
+        self.game_snd = pg.mixer.Sound(self.gamesound)
+        self.highscore_snd = pg.mixer.Sound(self.highscoresound)
+
         # Pre-load and pause all music tracks (they'll be unpaused as needed)
-        self.channel1.play(pg.mixer.Sound(self.menusound), loops=-1)
+        self.channel1.play(self.menu_snd, loops=-1)
         self.channel1.pause()
-        self.channel3.play(pg.mixer.Sound(self.gamesound), loops=-1)
+        self.channel3.play(self.game_snd, loops=-1)
         self.channel3.pause()
-        self.channel4.play(pg.mixer.Sound(self.highscoresound), loops=-1)
+        self.channel4.play(self.highscore_snd, loops=-1)
         self.channel4.pause()
         
         # Start the main game loop
@@ -167,23 +175,26 @@ class Main_Loop:
                 pg.quit()
                 break
 
-            # Look up the scene for this state. Unknown states are ignored.
+            # Look up the scene for this state. Each scene window blocks in its
+            # own loop until it changes the game state, so a scene is only
+            # (re)built when the state's scene differs from the one currently
+            # shown. Unknown states, or the current scene's own state, leave
+            # nothing to do: yield instead of busy-polling the state. This is
+            # a plain sleep; nothing else runs while this thread waits, so
+            # the state cannot change before it re-checks.
             scene = self._scenes.get(current_state)
-            if scene is None:
+            if scene is None or isinstance(self.current_window, scene[0]):
+                pg.time.wait(10)
                 continue
-            window_cls, build_window, channel = scene
-
-            # Each scene window blocks in its own loop until it changes the
-            # game state, so we only (re)build it when the state's scene differs
-            # from the one currently shown.
-            if not isinstance(self.current_window, window_cls):
-                # Unpause this scene's music (unless globally muted), run the
-                # blocking scene, then pause its music when it returns.
-                self._sm.active_channel = channel
-                if not self.pause_music:
-                    channel.unpause()
-                self.current_window = build_window()
-                channel.pause()
+            _, build_window, channel = scene
+
+            # Unpause this scene's music (unless globally muted), run the
+            # blocking scene, then pause its music when it returns.
+            self._sm.active_channel = channel
+            if not self.pause_music:
+                channel.unpause()
+            self.current_window = build_window()
+            channel.pause()
 
 
 if __name__ == "__main__":
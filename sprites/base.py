@@ -10,9 +10,10 @@ Two integration styles are intentionally preserved so behaviour does not change:
   * ``apply_physics()`` — friction-based motion (Player, Mob, ChaserMob).
   * ``apply_gravity()`` — simple gravity, no friction (Patrol/Jumper/Shooter).
 
-Subclasses create ``self.rect`` (and usually ``self.hitbox``) from a loaded
-image, call ``seed_body()`` to anchor the motion vectors, then each frame set
-``self.acc`` and call one of the integration helpers.
+Subclasses create ``self.rect`` from a loaded image (plus ``self.hitbox``
+when collisions should use an inset box, as the Player's do), call
+``seed_body()`` to anchor the motion vectors, then each frame set ``self.acc``
+and call one of the integration helpers.
 """
 
 import pygame as pg
@@ -39,23 +40,31 @@ class PhysicsSprite(pg.sprite.Sprite):
 
     def seed_body(self, center):
         """Anchor the motion vectors at ``center`` (typically ``rect.center``)."""
-        self.pos = pg.Vector2(center)
-        self.vel = pg.Vector2(0, 0)
-        self.acc = pg.Vector2(0, 0)
+        self.pos.update(center)
+        self.vel.update(0, 0)
+        self.acc.update(0, 0)
         self.on_floor = False
 
     def apply_physics(self, hitbox_dx=0, hitbox_dy=0):
         """Friction-based integration + wrap + rect/hitbox sync."""
-        self.acc.x += self.vel.x * self.FRICTION
-        self.vel += self.acc
-        self.pos += self.vel + self.ACC * self.acc
+        # Component-wise and in place: the vector expression form allocated
+        # three temporary Vector2s per body per tick.
+        acc, vel, pos = self.acc, self.vel, self.pos
+        acc.x += vel.x * self.FRICTION
+        vel.x += acc.x
+        vel.y += acc.y
+        pos.x += vel.x + self.ACC * acc.x
+        pos.y += vel.y + self.ACC * acc.y
         self._wrap_and_sync(hitbox_dx, hitbox_dy)
 
     def apply_gravity(self, hitbox_dx=0, hitbox_dy=0):
         """Simple gravity integration (no friction) + wrap + rect/hitbox sync."""
-        self.acc = pg.Vector2(0, self.ACC)
-        self.vel += self.acc
-        self.pos += self.vel
+        # In place, like apply_physics: no new Vector2s per body per tick.
+        acc, vel, pos = self.acc, self.vel, self.pos
+        acc.update(0, self.ACC)
+        vel.y += acc.y
+        pos.x += vel.x
+        pos.y += vel.y
         self._wrap_and_sync(hitbox_dx, hitbox_dy)
 
     def resolve_platform_landing(self, platforms):
@@ -71,7 +80,8 @@ class PhysicsSprite(pg.sprite.Sprite):
         resting exactly on a 1px-thin top edge stays planted (integer rects
         only touch, never overlap, at the rest position).
         """
-        collider = getattr(self, "hitbox", self.rect)
+        rect = self.rect
+        collider = getattr(self, "hitbox", rect)
         self.on_floor = False
         if self.vel.y < 0:
             return False
@@ -87,20 +97,22 @@ class PhysicsSprite(pg.sprite.Sprite):
                 self.on_floor = True
                 # Re-sync the collision rects so the feet rest exactly on the
                 # surface and prev_bottom == plat_top next frame (stable rest).
-                self.rect.bottom = plat_top
-                if hasattr(self, "hitbox"):
-                    self.hitbox.bottom = plat_top
+                rect.bottom = plat_top
+                if collider is not rect:
+                    collider.bottom = plat_top
                 return True
         return False
 
     def _wrap_and_sync(self, hitbox_dx=0, hitbox_dy=0):
         """Wrap horizontally across the screen and sync rect + hitbox to pos."""
+        rect, pos = self.rect, self.pos
         # Remember last frame's feet before re-syncing, for the one-way test.
-        self.prev_bottom = self.rect.bottom
-        if self.pos.x > self.WIDTH:
-            self.pos.x = 0
-        if self.pos.x < 0:
-            self.pos.x = self.WIDTH
-        self.rect.midbottom = self.pos
-        if hasattr(self, "hitbox"):
-            self.hitbox.topleft = (self.rect.left + hitbox_dx, self.rect.top + hitbox_dy)
+        self.prev_bottom = rect.bottom
+        # Python's % is floored, so this wraps both edges and keeps the
+        # distance travelled past the edge.
+        pos.x %= self.WIDTH
+        rect.midbottom = pos
+        hitbox = getattr(self, "hitbox", None)  # one lookup; mobs have none
+        if hitbox is not None:
+            hitbox.x = rect.x + hitbox_dx
+            hitbox.y = rect.y + hitbox_dy
@@ -22,6 +22,10 @@ Date: July 2025
 import pygame as pg
 import os
 
+from utils import assets
+
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
 
 class Goal(pg.sprite.Sprite):
     """
@@ -59,14 +63,10 @@ class Goal(pg.sprite.Sprite):
         pg.sprite.Sprite.__init__(self)
         
         # Set up path to images folder
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
+        self.img_folder_path = IMG_FOLDER_PATH
         
-        # Load the goal sprite image
-        self.image = pg.image.load(
-            os.path.join(self.img_folder_path, "Goal2.png")
-        ).convert_alpha()
+        # The goal sprite image (decoded once, shared by every Goal)
+        self.image = assets.get_image("Goal2.png")
         
         # Set up collision rectangle and position
         self.rect = self.image.get_rect()
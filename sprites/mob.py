@@ -1,51 +1,56 @@
-import pygame as pg
 import os
-from utils.spritesheet import Spritesheet
+from utils import assets
 from sprites.base import PhysicsSprite
 from constants import MOB_ACC, MOB_FRICTION
 
 """ Class for mob sprite. Shares vector physics with the player via
     PhysicsSprite (friction-based motion + screen wrap)."""
 
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
+# Walk cycle parsed from Mobsheet.png on first use and shared by every Mob.
+# Exactly four frames, so the frame index can wrap with ``& 3``.
+_WALK_FRAMES = None
+ANIM_FRAME_TICKS = 10  # Ticks each walk frame is shown
+
+
+def _get_walk_frames():
+    global _WALK_FRAMES
+    if _WALK_FRAMES is None:
+        spritesheet = assets.get_spritesheet("Mobsheet.png")
+        _WALK_FRAMES = [
+            spritesheet.parse_sprite("midle1.png"),
+            spritesheet.parse_sprite("mw1.png"),
+            spritesheet.parse_sprite("midle2.png"),
+            spritesheet.parse_sprite("mw2.png"),
+        ]
+    return _WALK_FRAMES
+
 
 class Mob(PhysicsSprite):
     def __init__(self):
         super().__init__(acc=MOB_ACC, friction=MOB_FRICTION)
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
-
-        # Load the spritesheet
-        self.spritesheet = Spritesheet("Mobsheet.png")
-
-        # Loading mob frames for animations
-        self.walk_frames = [
-            self.spritesheet.parse_sprite("midle1.png"),
-            self.spritesheet.parse_sprite("mw1.png"),
-            self.spritesheet.parse_sprite("midle2.png"),
-            self.spritesheet.parse_sprite("mw2.png"),
-        ]
+        self.img_folder_path = IMG_FOLDER_PATH
+
+        # Mob frames for animations (parsed once, shared between mobs)
+        self.walk_frames = _get_walk_frames()
 
         self.image = self.walk_frames[0]  # Start with the first frame
         self.frame_index = 0  # Track animation frame
-        self.animation_timer = 0  # Track time for animation
+        self._anim_countdown = ANIM_FRAME_TICKS  # Ticks until the next frame
 
         self.rect = self.image.get_rect()
         self.rect.center = (440, self.HEIGHT * 3 / 4 + 10)
         self.seed_body(self.rect.center)
 
-        self.hitbox = pg.Rect(
-            self.rect.left, self.rect.top, self.rect.width, self.rect.height
-        )
-
     def update(self, player_pos=None):
-        self.acc = pg.Vector2(0, self.ACC)
-
-        self.animation_timer += 2
+        self.acc.update(0, self.ACC)  # reset in place, no new Vector2
 
-        if self.animation_timer % 20 == 0:
-            self.frame_index = (self.frame_index + 1) % len(self.walk_frames)
+        self._anim_countdown -= 1
+        if self._anim_countdown <= 0:
+            self._anim_countdown = ANIM_FRAME_TICKS
+            self.frame_index = (self.frame_index + 1) & 3
             self.image = self.walk_frames[self.frame_index]
 
-        # Friction-based motion + screen wrap + rect/hitbox sync (shared base)
+        # Friction-based motion + screen wrap + rect sync (shared base)
         self.apply_physics()
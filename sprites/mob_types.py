@@ -28,10 +28,14 @@ Date: July 2025
 """
 
 import pygame as pg
+import math
 import os
 import random
-from utils.spritesheet import Spritesheet
+from utils import assets
 from sprites.base import PhysicsSprite
+from constants import WIDTH, HEIGHT
+
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
 
 
 def _crop(surf):
@@ -47,6 +51,42 @@ def _crop(surf):
     return surf.subsurface(bb).copy()
 
 
+# Animation frames per (sheet, frame names, crop), parsed on first spawn of a
+# kind and shared by every mob of that kind (frames are never drawn onto).
+_SHEET_FRAMES = {}
+
+
+def _sheet_frames(sheet, names, crop=True):
+    """Frames ``names`` from spritesheet ``sheet``, parsed once per process.
+
+    ``names`` must be a tuple (it is part of the cache key).
+    """
+    key = (sheet, names, crop)
+    frames = _SHEET_FRAMES.get(key)
+    if frames is None:
+        spritesheet = assets.get_spritesheet(sheet)
+        frames = [spritesheet.parse_sprite(name) for name in names]
+        if crop:
+            frames = [_crop(frame) for frame in frames]
+        _SHEET_FRAMES[key] = frames
+    return frames
+
+
+def _fire(mob, projectile):
+    """Add a freshly fired projectile to the loop-wide group when the level
+    wired one up (it updates, collides and draws every mob's shots in one
+    pass), otherwise to the mob's own group. Each shot lives in one group only,
+    so firing and Sprite.kill() touch a single group."""
+    group = mob.shared_projectiles
+    (mob.projectiles if group is None else group).add(projectile)
+
+
+def _update_projectiles(mob):
+    """Move a standalone mob's projectiles; shared ones are moved by the loop."""
+    if mob.shared_projectiles is None:
+        mob.projectiles.update()
+
+
 class BaseMob(PhysicsSprite):
     """
     Base class for all enemy types in the game.
@@ -81,12 +121,14 @@ class BaseMob(PhysicsSprite):
             
         Visual System:
             frame_index (int): Current animation frame
-            animation_timer (int): Animation timing counter
+            animation_timer (int): Ticks until the next walk frame
             
         Combat System:
             health (int): Current health points
     """
     
+    ANIM_FRAME_TICKS = 0  # Ticks each walk frame is shown (0 = not animated)
+
     def __init__(self, x, y):
         """
         Initialize the base mob with physics and AI systems.
@@ -107,16 +149,14 @@ class BaseMob(PhysicsSprite):
         super().__init__(acc=0.5, friction=-0.12)
 
         # Set up asset paths
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
+        self.img_folder_path = IMG_FOLDER_PATH
 
         # Anchor world position at the requested spawn point
-        self.pos = pg.Vector2(x, y)
+        self.pos.update(x, y)
 
         # Animation system
         self.frame_index = 0                # Current animation frame
-        self.animation_timer = 0            # Animation timing counter
+        self.animation_timer = self.ANIM_FRAME_TICKS  # Ticks until next frame
         
         # Combat system
         self.health = 1                     # Health points
@@ -131,46 +171,46 @@ class BaseMob(PhysicsSprite):
         """Basic gravity update (no friction) shared by the simpler mobs."""
         self.apply_gravity()
 
+    def advance_walk_cycle(self):
+        """Count down one tick; show the next walk frame every ANIM_FRAME_TICKS."""
+        self.animation_timer -= 1
+        if self.animation_timer <= 0:
+            self.animation_timer = self.ANIM_FRAME_TICKS
+            self.frame_index += 1
+            if self.frame_index == len(self.walk_frames):
+                self.frame_index = 0
+            self.image = self.walk_frames[self.frame_index]
+
 
 class ChaserMob(BaseMob):
     """Mob that chases the player (original behavior)"""
+    ANIM_FRAME_TICKS = 10
+
     def __init__(self, x=440, y=450):
         super().__init__(x, y)
         self.chase_speed = 1.4
         
-        # Load the spritesheet
-        self.spritesheet = Spritesheet("Mobsheet.png")
-        self.walk_frames = [
-            self.spritesheet.parse_sprite("midle1.png"),
-            self.spritesheet.parse_sprite("mw1.png"),
-            self.spritesheet.parse_sprite("midle2.png"),
-            self.spritesheet.parse_sprite("mw2.png"),
-        ]
+        # Walk cycle (parsed once, shared between chasers)
+        self.walk_frames = _sheet_frames(
+            "Mobsheet.png", ("midle1.png", "mw1.png", "midle2.png", "mw2.png"), crop=False
+        )
         
         self.image = self.walk_frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.hitbox = pg.Rect(
-            self.rect.left, self.rect.top, self.rect.width, self.rect.height
-        )
         
     def update(self, player_pos=None):
-        self.acc = pg.Vector2(0, self.ACC)
-        self.animation_timer += 2
-
-        if self.animation_timer % 20 == 0:
-            self.frame_index = (self.frame_index + 1) % len(self.walk_frames)
-            self.image = self.walk_frames[self.frame_index]
+        self.acc.update(0, self.ACC)  # reset in place, no new Vector2
+        self.advance_walk_cycle()
 
-        # Friction-based motion + screen wrap + rect/hitbox sync (shared base)
+        # Friction-based motion + screen wrap + rect sync (shared base)
         self.apply_physics()
 
     def chase_player(self, player_pos):
         """Chase behavior for player"""
-        if player_pos.x < self.pos.x:
-            self.vel.x = -self.chase_speed
-        elif player_pos.x > self.pos.x:
-            self.vel.x = self.chase_speed
+        # Head toward the player: sign of the offset (-1, 0 or 1) times speed.
+        dx = player_pos.x - self.pos.x
+        self.vel.x = self.chase_speed * ((dx > 0) - (dx < 0))
             
         # Jump if player is higher
         if player_pos.y + 40 < self.pos.y and self.on_floor:
@@ -180,6 +220,8 @@ class ChaserMob(BaseMob):
 
 class PatrolMob(BaseMob):
     """Mob that patrols back and forth"""
+    ANIM_FRAME_TICKS = 12
+
     def __init__(self, x, y, patrol_range=150):
         super().__init__(x, y)
         self.patrol_range = patrol_range
@@ -187,25 +229,15 @@ class PatrolMob(BaseMob):
         self.patrol_speed = 0.8
         self.direction = 1
 
-        # Load animated spritesheet; crop cells to tight visible art.
-        self.spritesheet = Spritesheet("Patrolsheet.png")
-        self.walk_frames = [
-            _crop(self.spritesheet.parse_sprite("patrol1.png")),
-            _crop(self.spritesheet.parse_sprite("patrol2.png")),
-        ]
+        # Animated frames cropped to tight visible art (shared per kind).
+        self.walk_frames = _sheet_frames("Patrolsheet.png", ("patrol1.png", "patrol2.png"))
         self.image = self.walk_frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.hitbox = pg.Rect(
-            self.rect.left, self.rect.top, self.rect.width, self.rect.height
-        )
 
     def update(self, player_pos=None):
         # Animate walk cycle
-        self.animation_timer += 1
-        if self.animation_timer % 12 == 0:
-            self.frame_index = (self.frame_index + 1) % len(self.walk_frames)
-            self.image = self.walk_frames[self.frame_index]
+        self.advance_walk_cycle()
 
         # Patrol behavior
         if abs(self.pos.x - self.start_x) > self.patrol_range:
@@ -222,19 +254,12 @@ class JumperMob(BaseMob):
         self.jump_timer = 0
         self.jump_interval = random.randint(60, 120)  # Random jump timing
 
-        # Load animated spritesheet; crop cells to tight visible art.
+        # Animated frames cropped to tight visible art (shared per kind).
         # Frame 0 = squashed (grounded), frame 1 = stretched (airborne).
-        self.spritesheet = Spritesheet("Jumpersheet.png")
-        self.walk_frames = [
-            _crop(self.spritesheet.parse_sprite("jumper1.png")),
-            _crop(self.spritesheet.parse_sprite("jumper2.png")),
-        ]
+        self.walk_frames = _sheet_frames("Jumpersheet.png", ("jumper1.png", "jumper2.png"))
         self.image = self.walk_frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.hitbox = pg.Rect(
-            self.rect.left, self.rect.top, self.rect.width, self.rect.height
-        )
 
     def update(self, player_pos=None):
         self.jump_timer += 1
@@ -249,8 +274,9 @@ class JumperMob(BaseMob):
         # Frame 0 = grounded/squashed, frame 1 = airborne/stretched
         self.image = self.walk_frames[0 if self.on_floor else 1]
 
-        # Slight horizontal movement
-        if random.randint(1, 100) == 1:
+        # Slight horizontal movement (1% chance per tick); one random() draw is
+        # much cheaper than randint's range handling every tick.
+        if random.random() < 0.01:
             self.vel.x = random.uniform(-1, 1)
 
         self.update_physics()
@@ -263,22 +289,16 @@ class ShooterMob(BaseMob):
         self.shoot_timer = 0
         self.shoot_interval = 120  # Shoot every 2 seconds at 60 FPS
         self.projectiles = pg.sprite.Group()
+        self.shared_projectiles = None  # Loop-wide projectile group (set by the level)
         self.last_player_pos = None
         self.fire_pose_timer = 0  # frames remaining to show the firing pose
 
-        # Load animated spritesheet; crop cells to tight visible art.
+        # Animated frames cropped to tight visible art (shared per kind).
         # Frame 0 = idle, frame 1 = firing pose (shown briefly after a shot).
-        self.spritesheet = Spritesheet("Shootersheet.png")
-        self.walk_frames = [
-            _crop(self.spritesheet.parse_sprite("shooter1.png")),
-            _crop(self.spritesheet.parse_sprite("shooter2.png")),
-        ]
+        self.walk_frames = _sheet_frames("Shootersheet.png", ("shooter1.png", "shooter2.png"))
         self.image = self.walk_frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.hitbox = pg.Rect(
-            self.rect.left, self.rect.top, self.rect.width, self.rect.height
-        )
 
     def update(self, player_pos=None):
         self.shoot_timer += 1
@@ -301,49 +321,53 @@ class ShooterMob(BaseMob):
         else:
             self.image = self.walk_frames[0]
 
-        # Update projectiles
-        self.projectiles.update()
+        _update_projectiles(self)
 
         self.update_physics()
 
     def shoot_at_player(self):
         """Create a projectile towards the player"""
         if self.last_player_pos:
-            projectile = Projectile(self.pos.x, self.pos.y, self.last_player_pos)
-            self.projectiles.add(projectile)
+            _fire(self, Projectile(self.pos.x, self.pos.y, self.last_player_pos))
 
 
 class Projectile(pg.sprite.Sprite):
     """Simple projectile for shooter mobs"""
+    _image = None  # shared yellow square, built on the first shot
+
     def __init__(self, start_x, start_y, target_pos):
         pg.sprite.Sprite.__init__(self)
-        self.image = pg.Surface((8, 8))
-        self.image.fill((255, 255, 0))  # Yellow projectile
+        if Projectile._image is None:
+            Projectile._image = pg.Surface((8, 8))
+            Projectile._image.fill((255, 255, 0))  # Yellow projectile
+        self.image = Projectile._image
         self.rect = self.image.get_rect()
         self.rect.center = (start_x, start_y)
         
-        # Calculate direction to target
-        direction = target_pos - pg.Vector2(start_x, start_y)
-        if direction.length() > 0:
-            direction = direction.normalize()
-        
-        self.vel = direction * 3  # Projectile speed
+        # Aim at the target at projectile speed 3 (still if already there)
+        dx = target_pos.x - start_x
+        dy = target_pos.y - start_y
+        dist = math.hypot(dx, dy)
+        scale = 3 / dist if dist else 0.0
+        self.vel = pg.Vector2(dx * scale, dy * scale)
         self.pos = pg.Vector2(start_x, start_y)
         self.lifetime = 180  # 3 seconds at 60 FPS
         
     def update(self):
-        self.pos += self.vel
-        self.rect.center = self.pos
+        pos = self.pos
+        pos += self.vel
+        self.rect.center = pos
         self.lifetime -= 1
-        
+
         # Remove if off screen or lifetime expired
-        if (self.lifetime <= 0 or self.pos.x < 0 or self.pos.x > 480 or 
-            self.pos.y < 0 or self.pos.y > 600):
+        if self.lifetime <= 0 or not (0 <= pos.x <= WIDTH and 0 <= pos.y <= HEIGHT):
             self.kill()
 
 
 class DiveBomberMob(BaseMob):
     """Hovers at altitude and periodically dive-bombs toward the player."""
+    _image = None  # shared dart image, drawn on the first spawn
+
     def __init__(self, x, y):
         super().__init__(x, y)
         self.hover_y = y
@@ -352,12 +376,14 @@ class DiveBomberMob(BaseMob):
         self.dive_interval = random.randint(90, 150)
         self.dive_duration = 35
 
-        self.image = pg.Surface((34, 26), pg.SRCALPHA)
-        pg.draw.polygon(self.image, (255, 140, 0), [(0, 0), (34, 0), (17, 26)])  # arrow/dart
-        pg.draw.polygon(self.image, (120, 50, 0), [(0, 0), (34, 0), (17, 26)], 2)
+        if DiveBomberMob._image is None:
+            image = pg.Surface((34, 26), pg.SRCALPHA)
+            pg.draw.polygon(image, (255, 140, 0), [(0, 0), (34, 0), (17, 26)])  # arrow/dart
+            pg.draw.polygon(image, (120, 50, 0), [(0, 0), (34, 0), (17, 26)], 2)
+            DiveBomberMob._image = image.convert_alpha()
+        self.image = DiveBomberMob._image
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.hitbox = pg.Rect(self.rect.left, self.rect.top, self.rect.width, self.rect.height)
 
     def update(self, player_pos=None):
         self.ai_timer += 1
@@ -403,19 +429,19 @@ class BossMob(BaseMob):
         self.move_speed = 1.6
         self.last_player_pos = None
         self.projectiles = pg.sprite.Group()
+        self.shared_projectiles = None  # Loop-wide projectile group (set by the level)
         self.shoot_timer = 0
         self.shoot_interval = 140
         self.telegraph_frames = 35
         self.charging = False
 
-        # Load boss spritesheet; crop to visible art for a tight collision rect.
-        spritesheet = Spritesheet("Bosssheet.png")
-        self._base_image = _crop(spritesheet.parse_sprite("boss_idle.png"))
-        self._charge_image = _crop(spritesheet.parse_sprite("boss_charge.png"))
+        # Boss frames cropped to visible art for a tight collision rect.
+        self._base_image, self._charge_image = _sheet_frames(
+            "Bosssheet.png", ("boss_idle.png", "boss_charge.png")
+        )
         self.image = self._base_image
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        self.hitbox = pg.Rect(self.rect.left, self.rect.top, self.rect.width, self.rect.height)
 
     def update(self, player_pos=None):
         if player_pos is not None:
@@ -439,7 +465,7 @@ class BossMob(BaseMob):
             self.charging = False
 
         self.image = self._charge_image if self.charging else self._base_image
-        self.projectiles.update()
+        _update_projectiles(self)
 
         self.pos += self.vel
         self._wrap_and_sync()
@@ -450,7 +476,14 @@ class BossMob(BaseMob):
             return
         for dx in (-70, -25, 25, 70):
             target = pg.Vector2(self.last_player_pos.x + dx, self.last_player_pos.y)
-            self.projectiles.add(Projectile(self.pos.x, self.pos.y, target))
+            _fire(self, Projectile(self.pos.x, self.pos.y, target))
+
+
+# Mob kinds that can spawn at levels 2-3, 4-5 and 6+ (level 1 is always a
+# chaser). Built once instead of a new list on every spawn.
+_EARLY_MOB_TYPES = (ChaserMob, PatrolMob)
+_MID_MOB_TYPES = (ChaserMob, PatrolMob, JumperMob)
+_LATE_MOB_TYPES = (ChaserMob, PatrolMob, JumperMob, ShooterMob, DiveBomberMob)
 
 
 def create_random_mob(x, y, level=1):
@@ -458,11 +491,9 @@ def create_random_mob(x, y, level=1):
     if level == 1:
         return ChaserMob(x, y)
     elif level <= 3:
-        mob_types = [ChaserMob, PatrolMob]
-        return random.choice(mob_types)(x, y)
+        mob_types = _EARLY_MOB_TYPES
     elif level <= 5:
-        mob_types = [ChaserMob, PatrolMob, JumperMob]
-        return random.choice(mob_types)(x, y)
+        mob_types = _MID_MOB_TYPES
     else:
-        mob_types = [ChaserMob, PatrolMob, JumperMob, ShooterMob, DiveBomberMob]
-        return random.choice(mob_types)(x, y)
+        mob_types = _LATE_MOB_TYPES
+    return random.choice(mob_types)(x, y)
@@ -22,6 +22,24 @@ Date: July 2025
 import pygame as pg
 import os
 from levels.themes import apply_tint
+from utils import assets
+
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
+# Scaled + tinted platform images keyed by (w, h, tint). Platforms never draw
+# onto their image, so every platform of the same size and biome can share one
+# Surface.
+_PLATFORM_IMAGES = {}
+
+
+def _get_platform_image(w, h, tint):
+    key = (w, h, tint)
+    image = _PLATFORM_IMAGES.get(key)
+    if image is None:
+        base = assets.get_image("plat3.png")
+        image = apply_tint(pg.transform.scale(base, (w, h)), tint)
+        _PLATFORM_IMAGES[key] = image
+    return image
 
 
 class Platform2(pg.sprite.Sprite):
@@ -64,9 +82,7 @@ class Platform2(pg.sprite.Sprite):
         """
         pg.sprite.Sprite.__init__(self)
 
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
+        self.img_folder_path = IMG_FOLDER_PATH
 
         self.image = self._load_platform(w, h, tint)
 
@@ -75,12 +91,8 @@ class Platform2(pg.sprite.Sprite):
         self.rect.y = y
 
     def _load_platform(self, w, h, tint):
-        """Load, scale, and optionally tint the platform image."""
-        image = pg.image.load(
-            os.path.join(self.img_folder_path, "plat3.png")
-        ).convert_alpha()
-        image = pg.transform.scale(image, (w, h))
-        return apply_tint(image, tint)
+        """Scaled and optionally tinted platform image (shared per size/tint)."""
+        return _get_platform_image(w, h, tint)
 
     # Keep old name as an alias so any external callers don't break.
     def load_platform2(self, w, h):
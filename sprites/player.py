@@ -19,7 +19,7 @@ Date: July 2025
 
 import pygame as pg
 import os
-from utils.spritesheet import Spritesheet
+from utils import assets
 from utils.database_logic import GetCoins, AddCoins
 from utils.cosmetics import SKINS, HATS, get_skin, get_hat
 from utils.player_stats import player_stats
@@ -37,6 +37,30 @@ from constants import (
     JUMP_BUFFER_FRAMES,
 )
 
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
+# Movement keys, resolved once instead of on every update
+K_LEFT, K_RIGHT, K_SPACE = pg.K_LEFT, pg.K_RIGHT, pg.K_SPACE
+
+# Animation states, used to index the per-state tables below
+IDLE, MOVING, JUMPING, FALLING = range(4)
+# Ticks between frame advances per state (None = single-frame pose)
+_FRAME_GATES = (20, 6, None, None)
+
+# Player animations: (attribute, spritesheet frames, hat x offset). Every frame
+# of an animation gets the equipped hat blitted at (hat x offset, HAT_Y).
+HAT_Y = -8
+_ANIM_SPECS = (
+    ("idle_left_frames", ("idlel1.png", "idlel2.png"), 8),
+    ("idle_right_frames", ("idler1.png", "idler2.png"), 18),
+    ("walk_left_frames", ("wl1.png", "wl2.png", "wl3.png", "wl4.png"), 8),
+    ("walk_right_frames", ("wr1.png", "wr2.png", "wr3.png", "wr4.png"), 18),
+    ("jumping_left_frames", ("jumpingl.png",), 8),
+    ("jumping_right_frames", ("jumpingr.png",), 18),
+    ("falling_left_frames", ("fallingl.png",), 8),
+    ("falling_right_frames", ("fallingr.png",), 18),
+)
+
 
 class Player(PhysicsSprite):
     """
@@ -64,9 +88,9 @@ class Player(PhysicsSprite):
             
         Animation System:
             frame_index (int): Current animation frame
-            animation_timer (int): Animation timing counter
+            animation_timer (int): Ticks left until the next frame advance
             playerleft (bool): Player facing direction
-            state (str): Current animation state
+            state (int): Current animation state (IDLE/MOVING/JUMPING/FALLING)
             
         Power-up System:
             speed_boost_timer (int): Remaining speed boost duration
@@ -81,6 +105,11 @@ class Player(PhysicsSprite):
             invincible_timer (int): Invincibility frames after damage
     """
 
+    # Composited animation frames per (spritesheet, hat surface), shared by
+    # every Player built with that skin and hat. Frames are never drawn onto
+    # after compositing.
+    _frame_cache = {}
+
     def __init__(self):
         """
         Initialize the player with default settings and load animation frames.
@@ -102,30 +131,26 @@ class Player(PhysicsSprite):
         super().__init__(acc=PLAYER_ACC, friction=FRICTION)
 
         # Set up file paths for game assets
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
-        
-        # Load character customization from the cosmetics system.
+        self.img_folder_path = IMG_FOLDER_PATH
+
+        # Load character customization from the cosmetics system. Images and
+        # sheets come from the shared asset cache, so a new Player (restart,
+        # next run) reuses the surfaces decoded by the first one.
         hat_id = get_hat()
         hat_spec = HATS.get(hat_id)
         self.hat_image = None
         if hat_spec and hat_spec["file"] is not None:
-            self.hat_image = pg.image.load(
-                os.path.join(self.img_folder_path, hat_spec["file"])
-            ).convert_alpha()
+            self.hat_image = assets.get_image(hat_spec["file"])
 
         # Load default character frame
-        self.startframe = pg.image.load(
-            os.path.join(self.img_folder_path, "IdleL2.png")
-        ).convert_alpha()
+        self.startframe = assets.get_image("IdleL2.png")
 
         # Animation state variables
         self.jumping, self.falling = False, False
         self.frame_index = 0              # Current frame in animation sequence
-        self.animation_timer = 0          # Timer for animation frame switching
+        self.animation_timer = _FRAME_GATES[IDLE]  # Countdown to the next frame
         self.playerleft = True            # Player facing direction (True = left)
-        self.state = "idle"              # Current animation state
+        self.state = IDLE                # Current animation state
 
         # Movement and physics state (pos/vel/acc, WIDTH, HEIGHT, ACC, FRICTION
         # are provided by PhysicsSprite).
@@ -140,9 +165,11 @@ class Player(PhysicsSprite):
         skin_idx = get_skin()
         skin_sheet = SKINS[skin_idx]["sheet"]
         if skin_idx == 0:
-            self.spritesheet = Spritesheet(skin_sheet)
+            self.spritesheet = assets.get_spritesheet(skin_sheet)
         else:
-            self.spritesheet = Spritesheet(skin_sheet, meta_filename="Playersheet.json")
+            self.spritesheet = assets.get_spritesheet(
+                skin_sheet, meta_filename="Playersheet.json"
+            )
 
         # Load character animations, blitting the hat on top if one is equipped.
         self.load_character(hat_img=self.hat_image)
@@ -188,39 +215,40 @@ class Player(PhysicsSprite):
     def update(self):
         """Update the player's position, state, and animations."""
 
-        self.acc = pg.Vector2(0, self.ACC)
-        self.animation_timer += 1
+        self.acc.update(0, self.ACC)  # reset in place, no new Vector2
+        self.animation_timer -= 1
         
         # Update power-up timers
         self.update_power_ups()
 
         keys = pg.key.get_pressed()
+        left, right = keys[K_LEFT], keys[K_RIGHT]
 
-        if not keys[pg.K_LEFT] and not keys[pg.K_RIGHT] and self.on_floor:
-            self.state = "idle"
+        if not left and not right and self.on_floor:
+            self.state = IDLE
 
         # Apply speed boost (temporary power-up) and the permanent move-speed upgrade
         speed_multiplier = 1.5 if self.speed_boost_timer > 0 else 1.0
         base_acc = self.ACC * speed_multiplier * self.run_accel_mult
 
-        if keys[pg.K_LEFT]:
+        if left:
             self.acc.x = -base_acc
-            self.state = "moving"
+            self.state = MOVING
             self.playerleft = True
 
-        if keys[pg.K_RIGHT]:
+        if right:
             self.acc.x = base_acc
-            self.state = "moving"
+            self.state = MOVING
             self.playerleft = False
 
         # Jumping with coyote time, jump buffering and double-jump support
-        self._update_jump(keys[pg.K_SPACE])
+        self._update_jump(keys[K_SPACE])
 
         if self.vel.y < 0:
-            self.state = "jumping"
+            self.state = JUMPING
 
         if self.vel.y > 0.5:
-            self.state = "falling"
+            self.state = FALLING
 
         self.animate()
         self._apply_squash()
@@ -229,6 +257,16 @@ class Player(PhysicsSprite):
         # The hitbox is inset (+10, +7) from the sprite rect.
         self.apply_physics(hitbox_dx=10, hitbox_dy=7)
 
+    def respawn(self, x, y):
+        """Move to a level's spawn point at rest, keeping health and progress.
+
+        pos and vel are reset in place rather than replaced with new vectors.
+        """
+        self.pos.update(x, y)
+        self.rect.center = self.pos
+        self.vel.update(0, 0)
+        self.on_floor = False
+
     def land(self):
         """Trigger the landing squash (called by the loop on ground contact)."""
         self.squash = 1.0
@@ -304,24 +342,14 @@ class Player(PhysicsSprite):
         squash/stretch pass downstream never compounds on an already-deformed
         surface. Frame advancement is still gated per state.
         """
-        # Pick the active frame list for the current state and facing, plus how
-        # often to advance the frame (None = single-frame poses).
-        if self.state == "moving":
-            frames = self.walk_left_frames if self.playerleft else self.walk_right_frames
-            gate = 6
-        elif self.state == "jumping":
-            frames = self.jumping_left_frames if self.playerleft else self.jumping_right_frames
-            gate = None
-        elif self.state == "falling":
-            frames = self.falling_left_frames if self.playerleft else self.falling_right_frames
-            gate = None
-        else:  # idle (and any fallback)
-            frames = self.idle_left_frames if self.playerleft else self.idle_right_frames
-            gate = 20
-
-        if gate is not None and self.animation_timer % gate == 0:
+        # Look up the active frame list for the current state and facing, plus
+        # how often to advance the frame.
+        frames = self._frame_lists[self.state][0 if self.playerleft else 1]
+        gate = _FRAME_GATES[self.state]
+
+        if gate is not None and self.animation_timer <= 0:
             self.frame_index = (self.frame_index + 1) % len(frames)
-            self.animation_timer = 0
+            self.animation_timer = gate
 
         # Clamp the shared frame index in case we just switched frame lists.
         self.image = frames[self.frame_index % len(frames)]
@@ -329,68 +357,41 @@ class Player(PhysicsSprite):
     def load_character(self, hat_img=None):
         """Load the player's animation frames from the spritesheet.
 
+        Builds one ``<anim>_frames`` list per entry in ``_ANIM_SPECS``. The
+        frames for a given skin and hat are composited once and then reused
+        from ``Player._frame_cache``.
+
         Args:
             hat_img: A ``pygame.Surface`` to blit onto every frame as a hat,
                 or ``None`` for no hat.  Pass the pre-loaded hat surface from
                 ``__init__``; this keeps the cosmetics logic there and keeps
-                this method purely concerned with frames.
+                this method purely concerned with frames.  Left-facing frames
+                anchor the hat further left than right-facing ones so it
+                tracks the character's head in both directions; the same
+                anchors work for every hat in the catalogue (they were drawn
+                to the same grid).
         """
-        self.idle_left_frames = [
-            self.spritesheet.parse_sprite("idlel1.png"),
-            self.spritesheet.parse_sprite("idlel2.png"),
-        ]
-        self.idle_right_frames = [
-            self.spritesheet.parse_sprite("idler1.png"),
-            self.spritesheet.parse_sprite("idler2.png"),
-        ]
-        self.walk_left_frames = [
-            self.spritesheet.parse_sprite("wl1.png"),
-            self.spritesheet.parse_sprite("wl2.png"),
-            self.spritesheet.parse_sprite("wl3.png"),
-            self.spritesheet.parse_sprite("wl4.png"),
-        ]
-        self.walk_right_frames = [
-            self.spritesheet.parse_sprite("wr1.png"),
-            self.spritesheet.parse_sprite("wr2.png"),
-            self.spritesheet.parse_sprite("wr3.png"),
-            self.spritesheet.parse_sprite("wr4.png"),
-        ]
-        self.jumping_left_frames = [self.spritesheet.parse_sprite("jumpingl.png")]
-        self.jumping_right_frames = [self.spritesheet.parse_sprite("jumpingr.png")]
-        self.falling_left_frames = [self.spritesheet.parse_sprite("fallingl.png")]
-        self.falling_right_frames = [self.spritesheet.parse_sprite("fallingr.png")]
-
-        if hat_img is not None:
-            self._apply_hat(hat_img)
-
-    def _apply_hat(self, hat_img):
-        """Blit *hat_img* onto every animation frame.
-
-        Left-facing frames anchor the hat at x=0, right-facing at x=10, so it
-        tracks the character's head in both directions.  The same anchor offsets
-        work for all hats in the catalogue (they were drawn to the same grid).
-
-        Args:
-            hat_img: A ``pygame.Surface`` containing the hat art.
-        """
-        left_groups = (
-            self.idle_left_frames,
-            self.walk_left_frames,
-            self.jumping_left_frames,
-            self.falling_left_frames,
-        )
-        right_groups = (
-            self.idle_right_frames,
-            self.walk_right_frames,
-            self.jumping_right_frames,
-            self.falling_right_frames,
+        key = (self.spritesheet, hat_img)
+        animations = Player._frame_cache.get(key)
+        if animations is None:
+            animations = {}
+            for name, filenames, hat_x in _ANIM_SPECS:
+                frames = [self.spritesheet.parse_sprite(f) for f in filenames]
+                if hat_img is not None:
+                    for frame in frames:
+                        frame.blit(hat_img, (hat_x, HAT_Y))
+                animations[name] = frames
+            Player._frame_cache[key] = animations
+        for name, frames in animations.items():
+            setattr(self, name, frames)
+
+        # (left, right) frame lists indexed by animation state
+        self._frame_lists = (
+            (self.idle_left_frames, self.idle_right_frames),
+            (self.walk_left_frames, self.walk_right_frames),
+            (self.jumping_left_frames, self.jumping_right_frames),
+            (self.falling_left_frames, self.falling_right_frames),
         )
-        for group in left_groups:
-            for frame in group:
-                frame.blit(hat_img, (8, -8))
-        for group in right_groups:
-            for frame in group:
-                frame.blit(hat_img, (18, -8))
 
     def update_power_ups(self):
         """Update all active power-up timers"""
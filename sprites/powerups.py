@@ -28,6 +28,13 @@ import pygame as pg
 import os
 import random
 import math
+from bisect import bisect
+from itertools import accumulate
+
+# Bob offsets 3*sin(0.1*t) for one full cycle (2*pi / 0.1 ~= 63 ticks), shared
+# by every power-up so the float animation is a table lookup, not a sin() call.
+_BOUNCE_PERIOD = 63
+_BOUNCE_OFFSETS = tuple(3 * math.sin(i * 0.1) for i in range(_BOUNCE_PERIOD))
 
 
 class BasePowerUp(pg.sprite.Sprite):
@@ -48,8 +55,12 @@ class BasePowerUp(pg.sprite.Sprite):
         collected (bool): Whether this power-up has been collected
         bounce_timer (int): Timer for floating animation
         original_y (float): Original Y position for bounce calculation
+
+    Each subclass draws its icon once in ``_build_image()``; every instance of
+    that type then shares the Surface (power-ups never draw onto it).
     """
-    
+    _image = None  # per-subclass icon, built on the first spawn
+
     def __init__(self, x, y):
         """
         Initialize a power-up at the specified location.
@@ -73,11 +84,17 @@ class BasePowerUp(pg.sprite.Sprite):
         visually appealing and easier to notice.
         """
         self.bounce_timer += 1
-        # Create a floating effect using sine wave
-        bounce_offset = 3 * math.sin(self.bounce_timer * 0.1)
-        self.pos.y = self.original_y + bounce_offset
+        # Create a floating effect using sine wave (precomputed, see above)
+        self.pos.y = self.original_y + _BOUNCE_OFFSETS[self.bounce_timer % _BOUNCE_PERIOD]
         self.rect.center = self.pos
         
+    @classmethod
+    def _shared_image(cls):
+        """This type's icon, drawn by ``_build_image()`` on first use."""
+        if cls._image is None:
+            cls._image = cls._build_image()
+        return cls._image
+
     def collect(self, player):
         """Called when player collects this power-up"""
         self.collected = True
@@ -88,15 +105,20 @@ class SpeedBoost(BasePowerUp):
     """Increases player speed temporarily"""
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20))
-        self.image.fill((255, 255, 0))  # Yellow
-        # Draw a lightning bolt symbol
-        pg.draw.polygon(self.image, (255, 255, 255), 
-                       [(10, 2), (6, 8), (12, 8), (8, 18), (14, 12), (8, 12)])
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.effect_duration = 300  # 5 seconds at 60 FPS
         
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20))
+        image.fill((255, 255, 0))  # Yellow
+        # Draw a lightning bolt symbol
+        pg.draw.polygon(image, (255, 255, 255),
+                       [(10, 2), (6, 8), (12, 8), (8, 18), (14, 12), (8, 12)])
+        return image
+
     def collect(self, player):
         player.add_speed_boost(self.effect_duration)
         super().collect(player)
@@ -106,16 +128,21 @@ class JumpBoost(BasePowerUp):
     """Increases player jump height temporarily"""
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20))
-        self.image.fill((0, 255, 0))  # Green
-        # Draw an up arrow
-        pg.draw.polygon(self.image, (255, 255, 255), 
-                       [(10, 2), (6, 8), (14, 8)])
-        pg.draw.rect(self.image, (255, 255, 255), (8, 8, 4, 10))
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.effect_duration = 300
         
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20))
+        image.fill((0, 255, 0))  # Green
+        # Draw an up arrow
+        pg.draw.polygon(image, (255, 255, 255),
+                       [(10, 2), (6, 8), (14, 8)])
+        pg.draw.rect(image, (255, 255, 255), (8, 8, 4, 10))
+        return image
+
     def collect(self, player):
         player.add_jump_boost(self.effect_duration)
         super().collect(player)
@@ -125,14 +152,19 @@ class HealthPotion(BasePowerUp):
     """Restores player health or gives extra life"""
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20))
-        self.image.fill((255, 0, 0))  # Red
-        # Draw a cross
-        pg.draw.rect(self.image, (255, 255, 255), (8, 4, 4, 12))
-        pg.draw.rect(self.image, (255, 255, 255), (4, 8, 12, 4))
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
-        
+
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20))
+        image.fill((255, 0, 0))  # Red
+        # Draw a cross
+        pg.draw.rect(image, (255, 255, 255), (8, 4, 4, 12))
+        pg.draw.rect(image, (255, 255, 255), (4, 8, 12, 4))
+        return image
+
     def collect(self, player):
         player.add_health()
         super().collect(player)
@@ -140,18 +172,27 @@ class HealthPotion(BasePowerUp):
 
 class Coin(BasePowerUp):
     """Collectible coin for currency"""
+    _images = {}  # value -> icon; coins differ in size and colour by value
+
     def __init__(self, x, y, value=1):
         super().__init__(x, y)
         self.value = value
+        self.image = self._images.get(value)
+        if self.image is None:
+            self.image = self._images[value] = self._build_coin_image(value)
+        self.rect = self.image.get_rect()
+        self.rect.center = (x, y)
+
+    @staticmethod
+    def _build_coin_image(value):
         size = 12 + (value * 2)  # Bigger coins for higher values
-        self.image = pg.Surface((size, size))
+        image = pg.Surface((size, size))
         color = (255, 215, 0) if value == 1 else (192, 192, 192) if value == 2 else (205, 127, 50)
-        self.image.fill(color)
+        image.fill(color)
         # Draw a circle
-        pg.draw.circle(self.image, (255, 255, 255), (size//2, size//2), size//2-2, 2)
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        
+        pg.draw.circle(image, (255, 255, 255), (size//2, size//2), size//2-2, 2)
+        return image
+
     def collect(self, player):
         player.add_coins(self.value)
         super().collect(player)
@@ -161,15 +202,20 @@ class Shield(BasePowerUp):
     """Temporary invincibility"""
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20))
-        self.image.fill((0, 191, 255))  # Light blue
-        # Draw a shield shape
-        pg.draw.polygon(self.image, (255, 255, 255), 
-                       [(10, 2), (4, 6), (4, 12), (10, 18), (16, 12), (16, 6)])
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.effect_duration = 1800  # 30 seconds
         
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20))
+        image.fill((0, 191, 255))  # Light blue
+        # Draw a shield shape
+        pg.draw.polygon(image, (255, 255, 255),
+                       [(10, 2), (4, 6), (4, 12), (10, 18), (16, 12), (16, 6)])
+        return image
+
     def collect(self, player):
         player.add_shield(self.effect_duration)
         super().collect(player)
@@ -179,17 +225,22 @@ class DoubleJump(BasePowerUp):
     """Enables double jump temporarily"""
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20))
-        self.image.fill((255, 0, 255))  # Magenta
-        # Draw two up arrows
-        pg.draw.polygon(self.image, (255, 255, 255), 
-                       [(7, 2), (4, 6), (10, 6)])
-        pg.draw.polygon(self.image, (255, 255, 255), 
-                       [(13, 8), (10, 12), (16, 12)])
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.effect_duration = 240  # 4 seconds
         
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20))
+        image.fill((255, 0, 255))  # Magenta
+        # Draw two up arrows
+        pg.draw.polygon(image, (255, 255, 255),
+                       [(7, 2), (4, 6), (10, 6)])
+        pg.draw.polygon(image, (255, 255, 255),
+                       [(13, 8), (10, 12), (16, 12)])
+        return image
+
     def collect(self, player):
         player.add_double_jump(self.effect_duration)
         super().collect(player)
@@ -201,15 +252,20 @@ class CoinMagnet(BasePowerUp):
 
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20), pg.SRCALPHA)
-        # Draw a horseshoe magnet (red body, grey tips).
-        pg.draw.arc(self.image, (220, 30, 30), (3, 2, 14, 18), 3.14, 6.28, 5)
-        pg.draw.rect(self.image, (200, 200, 200), (3, 11, 4, 6))
-        pg.draw.rect(self.image, (200, 200, 200), (13, 11, 4, 6))
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.effect_duration = 360  # 6 seconds at 60 FPS
 
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20), pg.SRCALPHA)
+        # Draw a horseshoe magnet (red body, grey tips).
+        pg.draw.arc(image, (220, 30, 30), (3, 2, 14, 18), 3.14, 6.28, 5)
+        pg.draw.rect(image, (200, 200, 200), (3, 11, 4, 6))
+        pg.draw.rect(image, (200, 200, 200), (13, 11, 4, 6))
+        return image.convert_alpha()
+
     def collect(self, player):
         player.add_magnet(self.effect_duration)
         super().collect(player)
@@ -219,37 +275,92 @@ class ExtraLife(BasePowerUp):
     """Permanently raises the player's maximum health by one."""
     def __init__(self, x, y):
         super().__init__(x, y)
-        self.image = pg.Surface((20, 20), pg.SRCALPHA)
-        # Draw a pink heart.
-        pg.draw.circle(self.image, (255, 80, 120), (7, 8), 5)
-        pg.draw.circle(self.image, (255, 80, 120), (13, 8), 5)
-        pg.draw.polygon(self.image, (255, 80, 120), [(3, 10), (17, 10), (10, 18)])
+        self.image = self._shared_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
 
+    @staticmethod
+    def _build_image():
+        image = pg.Surface((20, 20), pg.SRCALPHA)
+        # Draw a pink heart.
+        pg.draw.circle(image, (255, 80, 120), (7, 8), 5)
+        pg.draw.circle(image, (255, 80, 120), (13, 8), 5)
+        pg.draw.polygon(image, (255, 80, 120), [(3, 10), (17, 10), (10, 18)])
+        return image.convert_alpha()
+
     def collect(self, player):
         player.add_max_health()
         super().collect(player)
 
 
 class PowerUpManager:
-    """Manages power-up spawning and collection"""
+    """Manages power-up spawning and collection.
+
+    Power-ups are also bucketed in a uniform grid of 32px cells keyed by the
+    cell holding their centre, so collection only tests the few power-ups
+    near the player. Collected power-ups are queued for the game loop, which
+    drains them with ``drain_collected()`` to play its feedback effects.
+    """
+    CELL_SHIFT = 5   # 32px cells: key = (x >> 5, y >> 5)
+    QUERY_PAD = 10   # Half the largest power-up (20x20): its centre lies at
+                     # most this far outside any rect it overlaps
+
+    # Spawn table: coins common, Extra Life rare. Cumulative weights are summed
+    # once here rather than by random.choices on every spawn.
+    SPAWN_TYPES = (SpeedBoost, JumpBoost, HealthPotion, Coin, Shield,
+                   DoubleJump, CoinMagnet, ExtraLife)
+    SPAWN_WEIGHTS = (14, 14, 9, 28, 7, 11, 11, 3)
+    _SPAWN_CUM_WEIGHTS = tuple(accumulate(SPAWN_WEIGHTS))
+    _SPAWN_TOTAL = _SPAWN_CUM_WEIGHTS[-1]
+
     def __init__(self):
         self.power_ups = pg.sprite.Group()
         self.spawn_timer = 0
         self.spawn_interval = 120  # 2 seconds at 60 FPS
+        self.grid = {}             # (cell_x, cell_y) -> [power-ups centred there]
+        self._cell_of = {}         # power-up -> its current grid key
+        self._collected = []       # collected since the last drain_collected()
 
     def update(self, platforms, player=None):
         """Update all power-ups, apply the coin magnet, and spawn new ones."""
         self.spawn_timer += 1
         self.power_ups.update()
         self._apply_magnet(player)
+        self._rebucket()
 
         # Spawn new power-ups periodically
         if self.spawn_timer >= self.spawn_interval:
             self.spawn_random_powerup(platforms)
             self.spawn_timer = 0
 
+    def _cell(self, power_up):
+        x, y = power_up.rect.center
+        return (x >> self.CELL_SHIFT, y >> self.CELL_SHIFT)
+
+    def add(self, power_up):
+        """Add a power-up to the group and the collision grid."""
+        self.power_ups.add(power_up)
+        cell = self._cell(power_up)
+        self.grid.setdefault(cell, []).append(power_up)
+        self._cell_of[power_up] = cell
+
+    def _unbucket(self, power_up):
+        cell = self._cell_of.pop(power_up, None)
+        if cell is not None:
+            bucket = self.grid[cell]
+            bucket.remove(power_up)
+            if not bucket:
+                del self.grid[cell]
+
+    def _rebucket(self):
+        """Move power-ups whose centre drifted (bobbing, magnet) to a new cell."""
+        for power_up in self.power_ups:
+            cell = self._cell(power_up)
+            if self._cell_of.get(power_up) != cell:
+                self._unbucket(power_up)
+                self.grid.setdefault(cell, []).append(power_up)
+                self._cell_of[power_up] = cell
+
     def _apply_magnet(self, player):
         """While the magnet is active, pull nearby coins toward the player."""
         if player is None or getattr(player, "magnet_timer", 0) <= 0:
@@ -283,12 +394,10 @@ class PowerUpManager:
         
         y = platform.rect.top - 25
         
-        # Choose random power-up type
-        power_up_types = [SpeedBoost, JumpBoost, HealthPotion, Coin, Shield,
-                          DoubleJump, CoinMagnet, ExtraLife]
-        weights = [14, 14, 9, 28, 7, 11, 11, 3]  # Coins common; Extra Life rare
-        
-        power_up_class = random.choices(power_up_types, weights=weights)[0]
+        # Choose random power-up type (same draw random.choices would make)
+        power_up_class = self.SPAWN_TYPES[
+            bisect(self._SPAWN_CUM_WEIGHTS, random.random() * self._SPAWN_TOTAL)
+        ]
         
         # Special case for coins - sometimes spawn multiple
         if power_up_class == Coin:
@@ -300,15 +409,35 @@ class PowerUpManager:
                 power_up = Coin(x, y, 1)
         else:
             power_up = power_up_class(x, y)
-            
-        self.power_ups.add(power_up)
-        
+
+        self.add(power_up)
+
     def check_collisions(self, player):
-        """Check for power-up collisions with player"""
-        collected = pg.sprite.spritecollide(player, self.power_ups, False)
-        for power_up in collected:
+        """Collect the power-ups touching the player, testing only the grid
+        cells around it, and queue them for ``drain_collected()``.
+
+        Overlap is tested against the player's hitbox, not its sprite rect, so
+        pickups match what the player actually touches.
+        """
+        area = player.rect.inflate(2 * self.QUERY_PAD, 2 * self.QUERY_PAD)
+        hitbox = player.hitbox
+        shift = self.CELL_SHIFT
+        hits = []
+        for cx in range(area.left >> shift, (area.right >> shift) + 1):
+            for cy in range(area.top >> shift, (area.bottom >> shift) + 1):
+                for power_up in self.grid.get((cx, cy), ()):
+                    if power_up.rect.colliderect(hitbox):
+                        hits.append(power_up)
+        for power_up in hits:
+            self._unbucket(power_up)
             power_up.collect(player)
-            
+            self._collected.append(power_up)
+
+    def drain_collected(self):
+        """Return the power-ups collected since the last call and clear the queue."""
+        collected, self._collected = self._collected, []
+        return collected
+
     def draw(self, screen):
         """Draw all power-ups"""
         self.power_ups.draw(screen)
@@ -316,5 +445,5 @@ class PowerUpManager:
     def spawn_specific_powerup(self, power_up_type, x, y):
         """Spawn a specific power-up at given location"""
         power_up = power_up_type(x, y)
-        self.power_ups.add(power_up)
+        self.add(power_up)
         return power_up
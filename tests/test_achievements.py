@@ -0,0 +1,84 @@
+"""Tests for AchievementManager unlock bookkeeping."""
+
+import os
+
+import pytest
+
+from utils.achievements import COIN_TIERS, LEVEL_TIERS, AchievementManager
+from utils.save_manager import SaveManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A fresh manager saving to a temp file, with a throwaway coin wallet."""
+    import utils.achievements as ach_module
+    import utils.save_manager as sm_module
+
+    monkeypatch.setattr(sm_module, "_manager", SaveManager(str(tmp_path / "save.json")))
+    monkeypatch.setattr(ach_module, "ACHIEVEMENTS_PATH", str(tmp_path / "achievements.json"))
+    return AchievementManager()
+
+
+def test_level_tiers_unlock_every_tier_reached(manager):
+    unlocked = manager.check_tiers(LEVEL_TIERS, 10)
+    assert [a.id for a in unlocked] == ["first_level", "level_5", "level_10"]
+    assert not manager.achievements["level_25"].unlocked
+    assert manager.achievements["level_25"].progress == 10
+
+    # Already-unlocked tiers are not reported again.
+    assert manager.check_tiers(LEVEL_TIERS, 12) == []
+
+
+def test_unlocks_are_written_once_on_flush(manager):
+    manager.check_tiers(LEVEL_TIERS, 5)
+    assert manager.dirty
+    assert not os.path.exists(manager.achievements_file)
+
+    manager.flush()
+    assert not manager.dirty
+    reloaded = AchievementManager()
+    assert reloaded.achievements["level_5"].unlocked
+
+
+def test_progress_percentage_uses_exact_integer_math(manager):
+    ach = manager.achievements["collect_100_coins"]
+    ach.progress = 29
+    # int(29 / 100 * 100) would floor 28.999... down to 28.
+    assert ach.get_progress_percentage() == 29
+
+
+def test_unlock_aggregates_stay_in_step(manager):
+    manager.check_tiers(LEVEL_TIERS, 5)
+    assert [a.id for a in manager.get_unlocked_achievements()] == ["first_level", "level_5"]
+    assert manager.get_total_rewards_earned() == 15
+    assert manager.get_completion_percentage() == 2 * 100 // len(manager.achievements)
+
+    manager.flush()
+    assert AchievementManager().get_total_rewards_earned() == 15  # rebuilt on load
+
+    manager.reset()
+    assert manager.get_unlocked_achievements() == []
+    assert manager.get_total_rewards_earned() == 0
+
+
+def test_unlock_date_is_formatted_on_demand(manager):
+    ach = manager.achievements["first_level"]
+    assert ach.formatted_date() is None
+    ach.unlock()
+    assert isinstance(ach.unlock_date, float)
+    assert len(ach.formatted_date()) == len("2026-01-01 00:00:00")
+
+    # Saves written before timestamps hold a formatted string: it is read
+    # back as a timestamp and shown unchanged.
+    ach.from_dict({"unlocked": True, "unlock_date": "2026-06-01 20:28:50"})
+    assert isinstance(ach.unlock_date, float)
+    assert ach.formatted_date() == "2026-06-01 20:28:50"
+
+    ach.from_dict({"unlocked": True, "unlock_date": "not a date"})
+    assert ach.formatted_date() is None
+
+
+def test_coin_tiers_track_progress_below_the_first_tier(manager):
+    assert manager.check_tiers(COIN_TIERS, 40) == []
+    assert manager.achievements["collect_100_coins"].progress == 40
+    assert manager.achievements["collect_500_coins"].progress == 40
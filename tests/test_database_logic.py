@@ -74,6 +74,7 @@ def test_facade_add_coins(fresh_facade):
     db.SetCoins(10)
     assert db.AddCoins(5) == 15
     assert db.GetCoins() == 15
+    assert db.get_save_manager().dirty  # pickup stays in memory until a save
 
 
 def test_facade_highscore_only_increases(fresh_facade):
@@ -107,6 +108,28 @@ def test_add_increments_and_returns_total(tmp_path):
     assert sm.get("coins") == 15
 
 
+def test_deferred_set_waits_for_flush(tmp_path):
+    path = tmp_path / "save.json"
+    sm = SaveManager(str(path))
+    sm.set("coins", 3)
+    sm.add("coins", 4, defer=True)
+    assert sm.get("coins") == 7
+    assert SaveManager(str(path)).get("coins") == 3  # not on disk yet
+    sm.flush()
+    assert SaveManager(str(path)).get("coins") == 7
+    assert not sm.dirty
+
+
+def test_any_save_carries_deferred_changes(tmp_path):
+    path = tmp_path / "save.json"
+    sm = SaveManager(str(path))
+    sm.set("coins", 12, defer=True)
+    sm.set("score", 2)
+    reloaded = SaveManager(str(path))
+    assert reloaded.get("coins") == 12
+    assert not sm.dirty
+
+
 def test_reset_named_keys_only(tmp_path):
     sm = SaveManager(str(tmp_path / "save.json"))
     sm.update({"coins": 50, "score": 7, "highscore": 9})
@@ -0,0 +1,26 @@
+"""Tests for the shared font and rendered-text caches in utils.draw_text."""
+
+import pygame as pg
+
+from utils import draw_text as dt
+
+
+def test_fonts_are_loaded_once_per_size():
+    assert dt.get_font(18) is dt.get_font(18)
+    assert dt.get_font(18) is not dt.get_font(20)
+
+
+def test_repeat_labels_reuse_the_rendered_surface():
+    dt.invalidate_text_cache()
+    first = dt._render("Paused", 50, (0, 0, 0))
+    assert dt._render("Paused", 50, (0, 0, 0)) is first
+    assert dt._render("Paused", 50, (255, 255, 255)) is not first
+
+    dt.invalidate_text_cache()
+    assert dt._render("Paused", 50, (0, 0, 0)) is not first
+
+
+def test_draw_text_accepts_color_objects():
+    screen = pg.Surface((100, 40))
+    dt.draw_text(screen, "Hi", 16, 50, 20, pg.Color(255, 0, 0))
+    dt.draw_text(screen, "Hi", 16, 50, 20)
@@ -26,3 +26,59 @@ def test_start_hit_stop_takes_the_longer_freeze():
     assert em.hit_stop == 8
     em.start_hit_stop(2)  # a smaller one does not shorten it
     assert em.hit_stop == 8
+
+
+class _CountingFont:
+    """Font stand-in that counts render() calls."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def render(self, text, antialias, color):
+        import pygame as pg
+
+        self.renders += 1
+        return pg.Surface((10, 10))
+
+
+def test_floating_text_renders_once_over_its_lifetime():
+    import pygame as pg
+
+    em = EffectsManager()
+    font = _CountingFont()
+    screen = pg.Surface((100, 100))
+    em.add_floating_text(10, 10, "+1")
+    for _ in range(5):
+        em.update()
+        em.draw(screen, font)
+    assert font.renders == 1
+
+
+def test_floating_surface_is_drawn_without_rendering():
+    import pygame as pg
+
+    em = EffectsManager()
+    font = _CountingFont()
+    surface = pg.Surface((10, 10))
+    em.add_floating_surface(10, 10, surface)
+    em.add_floating_surface(30, 10, surface)  # prerendered surfaces can be shared
+    em.draw(pg.Surface((100, 100)), font)
+    assert font.renders == 0
+    assert [t.surface for t in em.floating_text.texts] == [surface, surface]
+
+
+def test_shaken_world_clears_the_uncovered_edges():
+    import pygame as pg
+
+    from constants import HEIGHT, WHITE, WIDTH
+    from gameloop.loop import Loop
+
+    loop = Loop.__new__(Loop)
+    loop.screen = pg.Surface((WIDTH, HEIGHT))
+    loop.screen.fill((200, 0, 0))
+    loop._shift_world(3, -2)
+
+    assert loop.screen.get_at((2, 10))[:3] == WHITE                  # left gap
+    assert loop.screen.get_at((10, HEIGHT - 1))[:3] == WHITE         # bottom gap
+    assert loop.screen.get_at((WIDTH - 1, 10))[:3] == (200, 0, 0)    # shifted world
+    assert loop.screen.get_at((3, HEIGHT - 3))[:3] == (200, 0, 0)
@@ -55,3 +55,46 @@ def test_boss_image_changes_while_charging():
 def test_dive_bomber_in_high_level_mob_pool():
     seen = {type(create_random_mob(100, 100, level=8)).__name__ for _ in range(200)}
     assert "DiveBomberMob" in seen
+
+
+def test_mobs_of_a_kind_share_their_frames():
+    from sprites.mob_types import ChaserMob, PatrolMob
+
+    a, b = ChaserMob(100, 300), ChaserMob(300, 300)
+    assert a.walk_frames is b.walk_frames
+    assert PatrolMob(100, 300).walk_frames is PatrolMob(300, 300).walk_frames
+
+
+def test_projectile_aims_at_target_at_fixed_speed():
+    from sprites.mob_types import Projectile
+
+    shot = Projectile(100, 100, pg.Vector2(130, 140))
+    assert abs(shot.vel.length() - 3) < 1e-9
+    assert abs(shot.vel.x - 1.8) < 1e-9 and abs(shot.vel.y - 2.4) < 1e-9
+    assert Projectile(100, 100, pg.Vector2(100, 100)).vel == pg.Vector2(0, 0)
+
+
+def test_chaser_walk_cycle_steps_every_ten_ticks():
+    from sprites.mob_types import ChaserMob
+
+    mob = ChaserMob(200, 300)
+    for _ in range(9):
+        mob.update()
+    assert mob.frame_index == 0
+    mob.update()
+    assert mob.frame_index == 1 and mob.image is mob.walk_frames[1]
+    for _ in range(30):
+        mob.update()
+    assert mob.frame_index == 0  # wrapped after the fourth frame
+
+
+def test_sheet_frame_cache_is_keyed_on_names_and_crop():
+    from sprites.mob_types import _sheet_frames
+
+    names = ("midle1.png", "mw1.png")
+    uncropped = _sheet_frames("Mobsheet.png", names, crop=False)
+    assert _sheet_frames("Mobsheet.png", names, crop=False) is uncropped
+    cropped = _sheet_frames("Mobsheet.png", names)
+    assert cropped is not uncropped
+    assert _sheet_frames("Mobsheet.png", names) is cropped
+    assert len(_sheet_frames("Mobsheet.png", names[:1], crop=False)) == 1
@@ -61,3 +61,102 @@ def test_magnet_ignores_far_coins():
     start = pg.Vector2(coin.pos)
     mgr._apply_magnet(p)
     assert pg.Vector2(coin.pos) == start
+
+
+def test_collision_collects_and_queues_touching_powerup():
+    p = Player()
+    mgr = PowerUpManager()
+    coin = mgr.spawn_specific_powerup(Coin, *p.rect.center)
+    far = mgr.spawn_specific_powerup(Coin, 5, 5)
+
+    mgr.check_collisions(p)
+    assert coin.collected and not far.collected
+    assert mgr.drain_collected() == [coin]
+    assert mgr.drain_collected() == []  # queue is cleared by draining
+    assert coin not in mgr.power_ups
+
+
+def test_collision_uses_player_hitbox_not_sprite_rect():
+    p = Player()
+    mgr = PowerUpManager()
+    # Inside the sprite rect's transparent left margin, clear of the hitbox.
+    coin = mgr.spawn_specific_powerup(Coin, p.rect.left, p.rect.top)
+    assert coin.rect.colliderect(p.rect)
+    assert not coin.rect.colliderect(p.hitbox)
+
+    mgr.check_collisions(p)
+    assert not coin.collected
+    assert mgr.drain_collected() == []
+
+
+def test_grid_tracks_powerups_that_move_between_cells():
+    p = Player()
+    mgr = PowerUpManager()
+    coin = mgr.spawn_specific_powerup(Coin, 400, 100)
+    # Move the coin onto the player (as the magnet would) and re-bucket it.
+    coin.pos = pg.Vector2(p.rect.center)
+    coin.original_y = coin.pos.y
+    coin.rect.center = coin.pos
+    mgr._rebucket()
+
+    mgr.check_collisions(p)
+    assert mgr.drain_collected() == [coin]
+    assert mgr.grid == {}
+
+
+def test_spawn_type_draw_matches_random_choices(monkeypatch):
+    import random
+
+    from sprites.platform import Platform2
+
+    platforms = pg.sprite.Group(Platform2(100, 300, 200, 20))
+    mgr = PowerUpManager()
+    spawned = []
+    monkeypatch.setattr(mgr, "add", spawned.append)
+    random.seed(1234)
+    for _ in range(50):
+        mgr.spawn_random_powerup(platforms)
+
+    random.seed(1234)
+    expected = []
+    for _ in range(50):
+        random.choice(platforms.sprites())
+        random.randint(120, 280)
+        kind = random.choices(PowerUpManager.SPAWN_TYPES, PowerUpManager.SPAWN_WEIGHTS)[0]
+        if kind is Coin and random.randint(1, 5) != 1:
+            random.randint(1, 20)  # silver missed: the gold roll
+        expected.append(kind)
+    assert [type(p) for p in spawned] == expected
+
+
+def test_power_up_icons_are_shared_per_type():
+    from sprites.powerups import Shield, SpeedBoost
+
+    assert Shield(10, 10).image is Shield(200, 300).image
+    assert SpeedBoost(10, 10).image is not Shield(10, 10).image
+    assert Coin(10, 10, 1).image is Coin(50, 50, 1).image
+    assert Coin(10, 10, 2).image.get_size() == (16, 16)
+
+
+def test_loop_credits_a_collected_coin_once(tmp_path, monkeypatch):
+    import utils.database_logic as db
+    import utils.save_manager as sm_module
+    from gameloop.loop import Loop
+    from utils.draw_text import get_font
+    from utils.effects import EffectsManager
+
+    monkeypatch.setattr(sm_module, "_manager", sm_module.SaveManager(str(tmp_path / "save.json")))
+    # Just the state _check_powerup_collision touches; Loop() itself runs the game.
+    loop = Loop.__new__(Loop)
+    loop.player = Player()
+    loop.powerup_manager = PowerUpManager()
+    loop.effects_manager = EffectsManager()
+    loop.font, loop._ui_cache = get_font(16), {}
+    loop.total_coins_collected = 0
+    coin = loop.powerup_manager.spawn_specific_powerup(Coin, *loop.player.hitbox.center)
+
+    before = db.GetCoins()
+    loop._check_powerup_collision()
+    assert coin.collected
+    assert db.GetCoins() - before == coin.value
+    assert loop.total_coins_collected == coin.value
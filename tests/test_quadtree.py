@@ -0,0 +1,70 @@
+"""Tests for the collision broad phases used by the game loop.
+
+A QuadTree query must return exactly what a brute-force ``colliderect`` scan
+over the same sprites would, however the tree happened to split, and the
+vectorised ``aabb_overlaps`` matrix must agree with ``colliderect`` pairwise.
+"""
+
+import random
+
+import numpy as np
+import pygame as pg
+
+from gameloop.loop import QuadTree, aabb_overlaps
+
+
+class Box:
+    """Minimal sprite stand-in — the tree only reads ``.rect``."""
+
+    def __init__(self, x, y, w, h):
+        self.rect = pg.Rect(x, y, w, h)
+
+
+def _brute_force(boxes, probe):
+    return {id(b) for b in boxes if b.rect.colliderect(probe)}
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(3)
+    boxes = [
+        Box(rng.randint(-20, 470), rng.randint(-20, 590), rng.randint(4, 120), rng.randint(4, 40))
+        for _ in range(60)
+    ]
+    tree = QuadTree.from_sprites(boxes)
+    assert tree.children is not None  # enough items to have split
+    for _ in range(200):
+        probe = pg.Rect(rng.randint(0, 480), rng.randint(0, 600), 30, 40)
+        assert {id(b) for b in tree.query(probe)} == _brute_force(boxes, probe)
+
+
+def test_empty_tree_returns_nothing():
+    tree = QuadTree.from_sprites([])
+    assert tree.query(pg.Rect(0, 0, 480, 600)) == []
+
+
+def test_straddling_item_is_found_from_either_side():
+    # Spans the vertical midline, so it stays at the root after the split.
+    wide = Box(200, 100, 80, 10)
+    boxes = [wide] + [Box(10 + i * 5, 500, 4, 4) for i in range(8)]
+    tree = QuadTree.from_sprites(boxes)
+    assert wide in tree.query(pg.Rect(205, 98, 5, 5))
+    assert wide in tree.query(pg.Rect(270, 98, 5, 5))
+
+
+def test_aabb_overlaps_matches_colliderect():
+    rng = random.Random(5)
+    rects_a = [pg.Rect(rng.randint(0, 400), rng.randint(0, 500), rng.randint(1, 60), rng.randint(1, 60))
+               for _ in range(25)]
+    rects_b = [pg.Rect(rng.randint(0, 400), rng.randint(0, 500), rng.randint(1, 90), rng.randint(1, 20))
+               for _ in range(15)]
+    # Shared edges must not count as overlap, as with colliderect.
+    rects_b.append(pg.Rect(rects_a[0].right, rects_a[0].top, 10, 10))
+
+    def as_boxes(rects):
+        return np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=float)
+
+    hits = aabb_overlaps(as_boxes(rects_a), as_boxes(rects_b))
+    assert hits.shape == (len(rects_a), len(rects_b))
+    for i, a in enumerate(rects_a):
+        for j, b in enumerate(rects_b):
+            assert hits[i, j] == a.colliderect(b)
@@ -8,7 +8,7 @@ import pygame as pg
 import pytest
 
 from sprites.mob import Mob
-from sprites.player import Player
+from sprites.player import FALLING, MOVING, Player
 from utils.save_manager import SaveManager
 
 
@@ -68,6 +68,37 @@ def test_player_constructs_with_physics_state():
     assert player.health > 0
 
 
+def test_player_respawn_resets_motion_in_place(temp_save):
+    player = Player()
+    pos, vel = player.pos, player.vel
+    player.pos.update(300, 100)
+    player.vel.update(4, -9)
+    player.on_floor = True
+    player.respawn(30, 450)
+    assert player.pos is pos and player.vel is vel
+    assert player.pos == pg.Vector2(30, 450)
+    assert player.vel == pg.Vector2(0, 0)
+    assert player.rect.center == (30, 450)
+    assert not player.on_floor
+
+
+def test_players_share_decoded_assets(temp_save):
+    first, second = Player(), Player()
+    assert first.spritesheet is second.spritesheet
+    assert first.startframe is second.startframe
+    assert first.walk_left_frames is second.walk_left_frames
+
+
+def test_player_animate_picks_frames_for_state_and_facing(temp_save):
+    player = Player()
+    player.state, player.playerleft = FALLING, False
+    player.animate()
+    assert player.image is player.falling_right_frames[0]
+    player.state, player.playerleft = MOVING, True
+    player.animate()
+    assert player.image in player.walk_left_frames
+
+
 def test_mob_update_advances_without_error():
     mob = Mob()
     start_y = mob.pos.y
@@ -87,7 +118,7 @@ def test_physics_friction_integration_is_deterministic():
     mob.update()
     assert mob.pos.x == 440
     assert abs(mob.pos.y - 460.75) < 1e-6
-    # rect and hitbox stay synced to pos.
+    # rect stays synced to pos.
     assert mob.rect.midbottom == (440, round(mob.pos.y)) or mob.rect.midbottom[0] == 440
 
 
@@ -138,3 +169,25 @@ def test_enemy_sprite_rect_is_tight(MobClass, spawn, cell_w, cell_h):
     # Sprites must have a proper image surface and physics state.
     assert isinstance(mob.image, pg.Surface)
     assert isinstance(mob.pos, pg.Vector2)
+
+
+def test_screen_wrap_keeps_overshoot_past_either_edge():
+    mob = Mob()
+    mob.pos = pg.Vector2(mob.WIDTH + 3, 300)
+    mob._wrap_and_sync()
+    assert mob.pos.x == 3
+    mob.pos = pg.Vector2(-2, 300)
+    mob._wrap_and_sync()
+    assert mob.pos.x == mob.WIDTH - 2
+
+
+def test_platforms_of_same_size_and_tint_share_one_image():
+    from sprites.platform import Platform2
+
+    a = Platform2(0, 100, 90, 20)
+    b = Platform2(200, 300, 90, 20)
+    c = Platform2(0, 100, 60, 20)
+    tinted = Platform2(0, 100, 90, 20, tint=(20, 20, 80, 47))
+    assert a.image is b.image
+    assert c.image is not a.image and c.image.get_size() == (60, 20)
+    assert tinted.image is not a.image
@@ -17,3 +17,10 @@ def test_get_sprite_matches_requested_size():
     sheet = Spritesheet("Mobsheet.png")
     sprite = sheet.get_sprite(0, 0, 24, 18)
     assert sprite.get_size() == (24, 18)
+
+
+def test_shared_assets_are_loaded_once():
+    from utils import assets
+
+    assert assets.get_spritesheet("Mobsheet.png") is assets.get_spritesheet("Mobsheet.png")
+    assert assets.get_image("Paus.png") is assets.get_image("Paus.png")
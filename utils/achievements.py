@@ -26,9 +26,34 @@ Author: Axel Suu
 Date: July 2025
 """
 
+import atexit
 import os
 import json
-from datetime import datetime
+import time
+from bisect import bisect_right
+
+TXT_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "txts"))
+ACHIEVEMENTS_PATH = os.path.join(TXT_FOLDER_PATH, "achievements.json")
+
+# Achievement ladders on a single metric, in ascending requirement order
+LEVEL_TIERS = ('first_level', 'level_5', 'level_10', 'level_25')
+COIN_TIERS = ('collect_100_coins', 'collect_500_coins')
+
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_unlock_date(value):
+    """Saved unlock date as a timestamp. Saves written before timestamps hold
+    a DATE_FORMAT string (local time); anything unreadable becomes None."""
+    if isinstance(value, str):
+        try:
+            return time.mktime(time.strptime(value, DATE_FORMAT))
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
 
 
 class Achievement:
@@ -53,7 +78,8 @@ class Achievement:
         reward (int): Reward value (usually coins) for unlocking
         unlocked (bool): Whether the achievement is unlocked
         progress (int): Current progress towards requirement
-        unlock_date (str): Date when achievement was unlocked
+        unlock_date (float): Unlock time as a Unix timestamp, or None while
+            locked; see ``formatted_date()``
     """
     
     def __init__(self, id, name, description, icon, requirement, reward=0):
@@ -101,11 +127,17 @@ class Achievement:
     def unlock(self):
         """Unlock this achievement"""
         self.unlocked = True
-        self.unlock_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.unlock_date = time.time()  # formatted only when displayed
+
+    def formatted_date(self):
+        """Unlock date as "YYYY-MM-DD HH:MM:SS", or None while locked."""
+        if self.unlock_date is None:
+            return None
+        return time.strftime(DATE_FORMAT, time.localtime(self.unlock_date))
         
     def get_progress_percentage(self):
-        """Get progress as percentage"""
-        return min(100, int((self.progress / self.requirement) * 100))
+        """Get progress as a whole percentage (integer math, no float rounding)"""
+        return min(100, self.progress * 100 // self.requirement)
         
     def to_dict(self):
         """Convert achievement to dictionary for saving"""
@@ -120,17 +152,21 @@ class Achievement:
         """Load achievement from dictionary"""
         self.unlocked = data.get('unlocked', False)
         self.progress = data.get('progress', 0)
-        self.unlock_date = data.get('unlock_date', None)
+        self.unlock_date = _parse_unlock_date(data.get('unlock_date'))
 
 
 class AchievementManager:
     """Manages all achievements"""
     def __init__(self):
         self.achievements = {}
-        self.txt_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "txts")
-        )
-        self.achievements_file = os.path.join(self.txt_folder_path, "achievements.json")
+        self.txt_folder_path = TXT_FOLDER_PATH
+        self.achievements_file = ACHIEVEMENTS_PATH
+        self._tiers = {}              # tier ids -> (achievements, requirements)
+        self.dirty = False            # unlocks not yet written by flush()
+        # Running aggregates over unlocked achievements, kept in step by
+        # _record_unlock() so the getters below need no scan.
+        self._unlocked = {}           # id -> Achievement, in unlock order
+        self._total_rewards = 0
         
         self.init_achievements()
         self.load_achievements()
@@ -255,33 +291,90 @@ class AchievementManager:
                 for achievement_data in data:
                     achievement_id = achievement_data['id']
                     if achievement_id in self.achievements:
-                        self.achievements[achievement_id].from_dict(achievement_data)
+                        achievement = self.achievements[achievement_id]
+                        achievement.from_dict(achievement_data)
+                        if achievement.unlocked:
+                            self._record_unlock(achievement)
         except (FileNotFoundError, json.JSONDecodeError):
             # File doesn't exist or is corrupted, use defaults
             pass
             
     def save_achievements(self):
         """Save achievement progress to file"""
+        # Serialize outside the try so a bug in the data raises instead of
+        # being swallowed; only I/O failures are tolerated.
+        text = json.dumps(
+            [achievement.to_dict() for achievement in self.achievements.values()],
+            separators=(',', ':'),  # machine-read only: no pretty-printing
+        )
         try:
-            data = [achievement.to_dict() for achievement in self.achievements.values()]
             with open(self.achievements_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except:
-            pass  # Ignore save errors
+                f.write(text)
+            self.dirty = False
+        except OSError as e:
+            print(f"Could not save achievements: {e}")
             
+    def _record_unlock(self, achievement):
+        """Add a newly unlocked achievement to the running aggregates."""
+        if achievement.id not in self._unlocked:
+            self._unlocked[achievement.id] = achievement
+            self._total_rewards += achievement.reward
+
+    def flush(self):
+        """Save achievement progress if anything unlocked since the last save."""
+        if self.dirty:
+            self.save_achievements()
+
     def check_achievement(self, achievement_id, current_value):
-        """Check if an achievement should be unlocked, granting its coin reward if so."""
-        if achievement_id in self.achievements:
-            was_unlocked = self.achievements[achievement_id].check_unlock(current_value)
-            if was_unlocked:
-                self.save_achievements()
-                achievement = self.achievements[achievement_id]
-                if achievement.reward > 0:
-                    from utils.database_logic import AddCoins
-                    AddCoins(achievement.reward)
-                return achievement
+        """Check if an achievement should be unlocked, granting its coin reward if so.
+
+        The unlock is only marked dirty; several unlocks in one level end are
+        written together by the next ``flush()``.
+        """
+        achievement = self.achievements.get(achievement_id)
+        if achievement is not None and achievement.check_unlock(current_value):
+            self._on_unlock(achievement)
+            return achievement
         return None
+
+    def _on_unlock(self, achievement):
+        """Bookkeeping for a fresh unlock: mark dirty, aggregate, pay reward."""
+        self.dirty = True
+        self._record_unlock(achievement)
+        if achievement.reward > 0:
+            from utils.database_logic import AddCoins
+            AddCoins(achievement.reward)
         
+    def check_tiers(self, tier_ids, current_value):
+        """Check a ladder of achievements tracking the same metric.
+
+        ``tier_ids`` must be in ascending requirement order. A bisect over the
+        requirements splits the tiers ``current_value`` has reached (unlocked
+        if still locked) from those above it (progress update only).
+
+        Returns:
+            list: The achievements newly unlocked by this call
+        """
+        # Resolve the ids to Achievement objects once per ladder, so later
+        # checks walk direct references instead of hashing id strings.
+        tiers = self._tiers.get(tier_ids)
+        if tiers is None:
+            achievements = tuple(self.achievements[aid] for aid in tier_ids)
+            tiers = (achievements, tuple(a.requirement for a in achievements))
+            self._tiers[tier_ids] = tiers
+        achievements, requirements = tiers
+        reached = bisect_right(requirements, current_value)
+
+        for achievement in achievements[reached:]:
+            achievement.check_unlock(current_value)
+
+        unlocked = []
+        for achievement in achievements[:reached]:
+            if achievement.check_unlock(current_value):
+                self._on_unlock(achievement)
+                unlocked.append(achievement)
+        return unlocked
+
     def get_achievement(self, achievement_id):
         """Get an achievement by ID"""
         return self.achievements.get(achievement_id)
@@ -291,22 +384,23 @@ class AchievementManager:
         return list(self.achievements.values())
         
     def get_unlocked_achievements(self):
-        """Get all unlocked achievements"""
-        return [ach for ach in self.achievements.values() if ach.unlocked]
+        """Get all unlocked achievements, in the order they were unlocked"""
+        return list(self._unlocked.values())
         
     def get_locked_achievements(self):
         """Get all locked achievements"""
-        return [ach for ach in self.achievements.values() if not ach.unlocked]
+        unlocked = self._unlocked
+        return [ach for aid, ach in self.achievements.items() if aid not in unlocked]
         
     def get_completion_percentage(self):
         """Get overall completion percentage"""
         total = len(self.achievements)
-        unlocked = len(self.get_unlocked_achievements())
-        return int((unlocked / total) * 100) if total > 0 else 0
+        unlocked = len(self._unlocked)
+        return unlocked * 100 // total if total > 0 else 0
         
     def get_total_rewards_earned(self):
         """Get total rewards earned from achievements"""
-        return sum(ach.reward for ach in self.achievements.values() if ach.unlocked)
+        return self._total_rewards
 
     def reset(self):
         """Reset all achievements to locked state and save."""
@@ -314,82 +408,98 @@ class AchievementManager:
             achievement.unlocked = False
             achievement.progress = 0
             achievement.unlock_date = None
+        self._unlocked.clear()
+        self._total_rewards = 0
         self.save_achievements()
 
 
-# Global achievement manager instance
-achievement_manager = AchievementManager()
+# Global achievement manager instance, created on first use so importing this
+# module (every screen does) doesn't read achievements.json up front.
+_manager = None
+
+
+def get_achievement_manager():
+    """Return the process-wide AchievementManager, creating it lazily."""
+    global _manager
+    if _manager is None:
+        _manager = AchievementManager()
+        atexit.register(_manager.flush)  # don't lose unlocks on quit
+    return _manager
+
+
+def __getattr__(name):
+    # Keeps ``from utils.achievements import achievement_manager`` working.
+    if name == "achievement_manager":
+        return get_achievement_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions for easy access
 def check_level_achievement(level):
     """Check level-based achievements"""
-    unlocked = []
-    unlocked.append(achievement_manager.check_achievement('first_level', level))
-    unlocked.append(achievement_manager.check_achievement('level_5', level))
-    unlocked.append(achievement_manager.check_achievement('level_10', level))
-    unlocked.append(achievement_manager.check_achievement('level_25', level))
-    return [ach for ach in unlocked if ach is not None]
+    return get_achievement_manager().check_tiers(LEVEL_TIERS, level)
 
 
 def check_coin_achievement(total_coins):
     """Check coin collection achievements"""
-    unlocked = []
-    unlocked.append(achievement_manager.check_achievement('collect_100_coins', total_coins))
-    unlocked.append(achievement_manager.check_achievement('collect_500_coins', total_coins))
-    return [ach for ach in unlocked if ach is not None]
+    return get_achievement_manager().check_tiers(COIN_TIERS, total_coins)
 
 
 def check_powerup_achievement(total_powerups):
     """Check power-up usage achievements"""
-    return achievement_manager.check_achievement('use_10_powerups', total_powerups)
+    return get_achievement_manager().check_achievement('use_10_powerups', total_powerups)
 
 
 def check_enemy_achievement(total_enemies):
     """Check enemy encounter achievements"""
-    return achievement_manager.check_achievement('defeat_10_enemies', total_enemies)
+    return get_achievement_manager().check_achievement('defeat_10_enemies', total_enemies)
 
 
 def check_no_damage_achievement():
     """Check no damage achievement"""
-    return achievement_manager.check_achievement('no_damage_level', 1)
+    return get_achievement_manager().check_achievement('no_damage_level', 1)
 
 
 def check_speed_run_achievement():
     """Check speed run achievement"""
-    return achievement_manager.check_achievement('speed_run', 1)
+    return get_achievement_manager().check_achievement('speed_run', 1)
 
 
 def check_jump_achievement(total_jumps):
     """Check jump-based achievements"""
-    return achievement_manager.check_achievement('jump_master', total_jumps)
+    return get_achievement_manager().check_achievement('jump_master', total_jumps)
 
 
 def check_hat_achievement():
     """Check hat purchase achievement"""
-    return achievement_manager.check_achievement('hat_collector', 1)
+    return get_achievement_manager().check_achievement('hat_collector', 1)
+
+
+def flush_achievements():
+    """Write any pending achievement unlocks to disk."""
+    get_achievement_manager().flush()
 
 
 def get_all_achievements():
     """Get all achievements"""
-    return achievement_manager.get_all_achievements()
+    return get_achievement_manager().get_all_achievements()
 
 
 def get_unlocked_achievements():
     """Get all unlocked achievements"""
-    return achievement_manager.get_unlocked_achievements()
+    return get_achievement_manager().get_unlocked_achievements()
 
 
 def get_completion_percentage():
     """Get completion percentage"""
-    return achievement_manager.get_completion_percentage()
+    return get_achievement_manager().get_completion_percentage()
 
 
 def get_total_rewards_earned():
     """Get total rewards earned"""
-    return achievement_manager.get_total_rewards_earned()
+    return get_achievement_manager().get_total_rewards_earned()
 
 
 def reset_all_achievements():
     """Reset all achievements to locked state (call on game restart)."""
-    achievement_manager.reset()
+    get_achievement_manager().reset()
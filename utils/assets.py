@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Skybound shared image assets.
+
+Sprites are rebuilt every level (platforms, goal, pause button, mobs), so each
+image and spritesheet is decoded and converted once per process here and the
+same Surface is handed to every sprite that uses it. Sprites never draw onto
+these shared surfaces.
+
+Loading is lazy: the first request must come after ``pg.display.set_mode`` so
+``convert_alpha`` can pick the display's pixel format.
+"""
+
+import os
+
+import pygame as pg
+
+from utils.spritesheet import Spritesheet
+
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
+_images = {}  # filename -> converted Surface
+_sheets = {}  # (filename, meta_filename) -> Spritesheet
+
+
+def get_image(filename):
+    """Image ``filename`` from imgs/, loaded and converted on first use."""
+    image = _images.get(filename)
+    if image is None:
+        image = pg.image.load(os.path.join(IMG_FOLDER_PATH, filename)).convert_alpha()
+        _images[filename] = image
+    return image
+
+
+def get_spritesheet(filename, meta_filename=None):
+    """Spritesheet ``filename`` (with its JSON metadata), parsed on first use.
+
+    ``meta_filename`` is passed through to ``Spritesheet`` so recolored sheets
+    can share another sheet's JSON layout.
+    """
+    key = (filename, meta_filename)
+    sheet = _sheets.get(key)
+    if sheet is None:
+        sheet = Spritesheet(filename, meta_filename=meta_filename)
+        _sheets[key] = sheet
+    return sheet
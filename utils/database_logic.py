@@ -53,9 +53,14 @@ def GetHighScore():
 
 
 def SetHighScore(newHighScore):
-    """Update the high score only if it beats the stored one."""
-    if int(newHighScore) > GetHighScore():
-        get_save_manager().set("highscore", int(newHighScore))
+    """Update the high score only if it beats the stored one.
+
+    The comparison reads the in-memory save, so only a new best touches disk.
+    """
+    new_high = int(newHighScore)
+    sm = get_save_manager()
+    if new_high > sm.get("highscore"):
+        sm.set("highscore", new_high)
 
 
 def manualSetHighScore(newHighScore):
@@ -102,8 +107,12 @@ def SetCoins(coins):
 
 
 def AddCoins(amount):
-    """Add coins to the running total and return the new total."""
-    return int(get_save_manager().add("coins", int(amount)))
+    """Add coins to the running total and return the new total.
+
+    Called on every coin pickup, so the write is deferred: it rides along with
+    the next save (level change, game over, purchase) or the flush at exit.
+    """
+    return int(get_save_manager().add("coins", int(amount), defer=True))
 
 
 def ResetProgress():
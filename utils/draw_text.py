@@ -20,6 +20,7 @@ Date: July 2025
 
 import pygame as pg
 import os
+from functools import lru_cache
 
 _FONT_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "font", "Outfit-Regular.ttf")
@@ -28,6 +29,33 @@ _BLACK = (0, 0, 0)
 _font_cache: dict = {}
 
 
+def get_font(size):
+    """Return the Outfit font at ``size``, loading it once per size.
+
+    Falls back to pygame's default font if the TTF cannot be loaded. The
+    same Font objects are shared by the menus and the in-game HUD.
+    """
+    font = _font_cache.get(size)
+    if font is None:
+        try:
+            font = pg.font.Font(_FONT_PATH, size)
+        except (OSError, pg.error):
+            font = pg.font.Font(None, size)
+        _font_cache[size] = font
+    return font
+
+
+@lru_cache(maxsize=256)
+def _render(text, size, color):
+    """Rendered surface for ``text``; menus redraw the same labels every frame."""
+    return get_font(size).render(text, True, color)
+
+
+def invalidate_text_cache():
+    """Drop all memoized text surfaces (e.g. after a display-mode change)."""
+    _render.cache_clear()
+
+
 def draw_text(screen, text, size, x, y, color=None):
     """Draw center-aligned text at (x, y) using the Outfit font.
 
@@ -38,10 +66,7 @@ def draw_text(screen, text, size, x, y, color=None):
         x, y (float): Centre coordinates of the rendered text.
         color (tuple | None): RGB color tuple.  Defaults to black when None.
     """
-    if size not in _font_cache:
-        _font_cache[size] = pg.font.Font(_FONT_PATH, size)
-    font = _font_cache[size]
-    text_surface = font.render(text, True, color if color is not None else _BLACK)
+    text_surface = _render(text, size, _BLACK if color is None else tuple(color))
     text_rect = text_surface.get_rect()
     text_rect.center = (x, y)
     screen.blit(text_surface, text_rect)
@@ -186,13 +186,18 @@ class ScreenShake:
 
 
 class FloatingText:
-    """Floating text for score/damage indicators"""
-    def __init__(self, x, y, text, color=(255, 255, 255), size=20):
+    """Floating text for score/damage indicators.
+
+    The text is rendered once, on its first draw, unless a prerendered
+    ``surface`` is passed in; later frames only change its alpha.
+    """
+    def __init__(self, x, y, text, color=(255, 255, 255), size=20, surface=None):
         self.x = x
         self.y = y
         self.text = text
         self.color = color
         self.size = size
+        self.surface = surface
         self.lifetime = 120  # 2 seconds
         self.max_lifetime = 120
         self.vel_y = -1  # Float upward
@@ -206,11 +211,11 @@ class FloatingText:
         """Draw floating text"""
         if self.lifetime > 0:
             alpha = int(255 * (self.lifetime / self.max_lifetime))
-            # Create text surface
-            text_surface = font.render(self.text, True, self.color)
-            # Apply alpha
-            text_surface.set_alpha(alpha)
-            screen.blit(text_surface, (self.x, self.y))
+            if self.surface is None:
+                self.surface = font.render(self.text, True, self.color)
+            # Apply alpha (prerendered surfaces may be shared, so set it per blit)
+            self.surface.set_alpha(alpha)
+            screen.blit(self.surface, (self.x, self.y))
             
     def is_alive(self):
         """Check if text is still alive"""
@@ -226,6 +231,10 @@ class FloatingTextManager:
         """Add floating text"""
         floating_text = FloatingText(x, y, text, color, size)
         self.texts.append(floating_text)
+
+    def add_surface(self, x, y, surface):
+        """Add floating text that was already rendered to ``surface``"""
+        self.texts.append(FloatingText(x, y, None, surface=surface))
         
     def update(self):
         """Update all floating texts"""
@@ -283,5 +292,8 @@ class EffectsManager:
     def add_floating_text(self, x, y, text, color=(255, 255, 255)):
         self.floating_text.add_text(x, y, text, color)
 
+    def add_floating_surface(self, x, y, surface):
+        self.floating_text.add_surface(x, y, surface)
+
     def get_shake_offset(self):
         return self.screen_shake.get_offset()
@@ -11,6 +11,8 @@ JSON file loaded once into memory. Benefits:
   had no error handling and would raise on a missing file).
 - State lives in memory, so reads are free — the main loop no longer hits the
   disk every frame to check the game state.
+- Hot-path writes can be deferred (``defer=True``) and are coalesced into the
+  next save, an explicit ``flush()``, or the flush registered at exit.
 
 ``database_logic.py`` delegates to the module-level ``get_save_manager()``
 singleton, so existing call sites keep working unchanged.
@@ -18,6 +20,7 @@ singleton, so existing call sites keep working unchanged.
 Author: Axel Suu (revived 2026)
 """
 
+import atexit
 import copy
 import json
 import os
@@ -62,6 +65,7 @@ class SaveManager:
         self.txt_folder = txt_folder
         self.data = copy.deepcopy(DEFAULTS)
         self.gamestate = "MAIN_MENU"  # runtime only, never persisted
+        self.dirty = False            # deferred changes not yet on disk
         self.load()
 
     def load(self):
@@ -129,8 +133,9 @@ class SaveManager:
         try:
             fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
             with os.fdopen(fd, "w") as f:
-                json.dump(self.data, f, indent=2)
+                json.dump(self.data, f, separators=(",", ":"))
             os.replace(tmp_path, self.path)
+            self.dirty = False
         except OSError:
             # Never let a failed save crash the game.
             if "tmp_path" in dir() and os.path.exists(tmp_path):
@@ -141,19 +146,28 @@ class SaveManager:
             return self.data[key]
         return default if default is not None else DEFAULTS.get(key)
 
-    def set(self, key, value):
+    def set(self, key, value, defer=False):
+        """Store ``value``; with ``defer`` it waits for the next save/flush."""
         self.data[key] = value
-        self.save()
+        if defer:
+            self.dirty = True
+        else:
+            self.save()
+
+    def flush(self):
+        """Write deferred changes, if there are any."""
+        if self.dirty:
+            self.save()
 
     def update(self, mapping):
         """Set several keys at once, persisting with a single write."""
         self.data.update(mapping)
         self.save()
 
-    def add(self, key, amount):
+    def add(self, key, amount, defer=False):
         """Atomically increment a numeric field and return the new total."""
         new_total = self.get(key) + amount
-        self.set(key, new_total)
+        self.set(key, new_total, defer=defer)
         return new_total
 
     def reset(self, *keys):
@@ -177,4 +191,5 @@ def get_save_manager():
     global _manager
     if _manager is None:
         _manager = SaveManager(SAVE_PATH, TXT_FOLDER)
+        atexit.register(_manager.flush)  # don't lose deferred writes on quit
     return _manager
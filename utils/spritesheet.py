@@ -28,6 +28,8 @@ import pygame as pg
 import json
 import os
 
+IMG_FOLDER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "imgs"))
+
 
 class Spritesheet:
     """
@@ -73,9 +75,7 @@ class Spritesheet:
         corresponding JSON metadata file.
         """
         # Set up path to images folder
-        self.img_folder_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "imgs")
-        )
+        self.img_folder_path = IMG_FOLDER_PATH
 
         # Load the spritesheet image
         self.filename = os.path.join(self.img_folder_path, filename)
@@ -99,10 +99,13 @@ class AchievementScreen:
                     progress_text = f"{achievement.progress}/{achievement.requirement}"
                     draw_text(self.screen, progress_text, 10, progress_x + progress_bar_width/2, progress_y + 15)
                     
-                # Reward text
+                # Reward text (and unlock date for unlocked achievements)
                 if achievement.unlocked:
                     reward_text = f"Reward: {achievement.reward} coins"
                     draw_text(self.screen, reward_text, 10, self.WIDTH - 80, y_pos + 45)
+                    unlocked_on = achievement.formatted_date()
+                    if unlocked_on:
+                        draw_text(self.screen, f"Unlocked {unlocked_on}", 10, 120, y_pos + 45)
                 else:
                     reward_text = f"Reward: {achievement.reward} coins"
                     draw_text(self.screen, reward_text, 10, self.WIDTH - 80, y_pos + 45)
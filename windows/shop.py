@@ -233,7 +233,8 @@ class Shop:
             self.message = f"Equipped {cosm.HATS[hat_id]['name']} hat!"
         elif cosm.buy_hat(hat_id):
             self.message = f"Unlocked {cosm.HATS[hat_id]['name']} hat!"
-            from utils.achievements import check_hat_achievement
+            from utils.achievements import check_hat_achievement, flush_achievements
             check_hat_achievement()
+            flush_achievements()
         else:
             self.message = "Not enough coins!"